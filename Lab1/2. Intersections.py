@@ -90,9 +90,19 @@ def intersection_line_circle(line_p1, line_p2, center, radius):
     B = x1 - x2
     C = x2 * y1 - x1 * y2
 
+    if B == 0:
+        # Вертикальная прямая x = -C / A: подставляем x в уравнение окружности и решаем относительно y
+        x = -C / A
+        h = radius ** 2 - (x - x0) ** 2
+        if h < 0:
+            return []
+        if h == 0:
+            return [(x, y0)]
+        return [(x, y0 + math.sqrt(h)), (x, y0 - math.sqrt(h))]
+
     a = A ** 2 + B ** 2
-    b = 2 * (A * B * y0 - A * C - B ** 2 * x0)
-    c = (C - B * y0) ** 2 + B ** 2 * (x0 ** 2 - radius ** 2)
+    b = 2 * (A * C + A * B * y0 - B ** 2 * x0)
+    c = (C + B * y0) ** 2 + B ** 2 * (x0 ** 2 - radius ** 2)
 
     discriminant = b ** 2 - 4 * a * c
     if discriminant < 0:
@@ -100,12 +110,12 @@ def intersection_line_circle(line_p1, line_p2, center, radius):
 
     points = []
     x = (-b + math.sqrt(discriminant)) / (2 * a)
-    y = (-A * x - C) / B if B != 0 else (C + A * x) / B
+    y = (-A * x - C) / B
     if discriminant == 0:
         points.append((x, y))
     else:
         x2 = (-b - math.sqrt(discriminant)) / (2 * a)
-        y2 = (-A * x2 - C) / B if B != 0 else (C + A * x2) / B
+        y2 = (-A * x2 - C) / B
         points.extend([(x, y), (x2, y2)])
     return points
 
@@ -0,0 +1,177 @@
+from time import perf_counter
+
+import numpy as np
+
+from Lab1.lab_modules import load_lab_module
+
+NO_HIT, TANGENT, TWO_HITS = 0, 1, 2
+
+
+def _as_points(points) -> np.ndarray:
+    """Массив точек формы (..., 2) в float64."""
+    points = np.asarray(points, dtype=np.float64)
+    if points.shape[-1] != 2:
+        raise ValueError("batch_intersections: points must have shape (..., 2).")
+    return points
+
+
+def _cross(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+
+
+def _dot(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[..., 0] * v[..., 0] + u[..., 1] * v[..., 1]
+
+
+def _line_params(p1, p2, p3, p4):
+    """
+    Параметры t и u точки пересечения прямых p1 + t*(p2 - p1) и p3 + u*(p4 - p3).
+    det = 0 - прямые параллельны или совпадают, для них маска False.
+    """
+    p1, p2, p3, p4 = map(_as_points, (p1, p2, p3, p4))
+    d1, d2, w = p2 - p1, p4 - p3, p3 - p1
+    det = _cross(d1, d2)
+    mask = det != 0
+    safe_det = np.where(mask, det, 1.0)
+    t = _cross(w, d2) / safe_det
+    u = _cross(w, d1) / safe_det
+    return p1, d1, t, u, mask
+
+
+def batch_two_lines(p1, p2, p3, p4) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Векторный аналог intersection_two_lines для N пар прямых (p1, p2) и (p3, p4).
+    Аргументы - массивы формы (N, 2) или одна точка (2,), они транслируются друг на друга.
+    Возвращает (points, mask): точки формы (N, 2) (NaN там, где пересечения нет) и маску формы (N,).
+    """
+    p1, d1, t, _, mask = _line_params(p1, p2, p3, p4)
+    points = p1 + t[..., None] * d1
+    points[~mask] = np.nan
+    return points, mask
+
+
+def batch_line_segment(line_p1, line_p2, seg_p1, seg_p2) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Векторный аналог intersection_line_segment: точка пересечения прямой должна лежать на отрезке.
+    """
+    p1, d1, t, u, mask = _line_params(line_p1, line_p2, seg_p1, seg_p2)
+    mask &= (u >= 0) & (u <= 1)
+    points = p1 + t[..., None] * d1
+    points[~mask] = np.nan
+    return points, mask
+
+
+def batch_two_segments(p1, p2, p3, p4) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Векторный аналог intersection_two_segments для N пар отрезков (p1, p2) и (p3, p4).
+    """
+    p1, d1, t, u, mask = _line_params(p1, p2, p3, p4)
+    mask &= (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+    points = p1 + t[..., None] * d1
+    points[~mask] = np.nan
+    return points, mask
+
+
+def _line_circle_params(p1, p2, centers, radii):
+    """
+    Корни t уравнения |p1 + t*(p2 - p1) - center|^2 = r^2 и число корней для каждой пары.
+    Параметрическая форма одинаково работает для вертикальных прямых (B = 0 в форме Ax + By + C = 0).
+    """
+    p1, p2, centers = map(_as_points, (p1, p2, centers))
+    radii = np.asarray(radii, dtype=np.float64)
+    d, f = p2 - p1, p1 - centers
+    a = _dot(d, d)
+    b = 2 * _dot(f, d)
+    c = _dot(f, f) - radii ** 2
+
+    # Вырожденная прямая (p1 == p2) не задаёт направления - пересечений нет
+    valid = a != 0
+    safe_a = np.where(valid, a, 1.0)
+    discriminant = b ** 2 - 4 * a * c
+    counts = np.where(discriminant > 0, TWO_HITS, np.where(discriminant == 0, TANGENT, NO_HIT))
+    counts = np.where(valid, counts, NO_HIT).astype(np.int8)
+
+    root = np.sqrt(np.maximum(discriminant, 0.0))
+    t = np.stack(((-b + root) / (2 * safe_a), (-b - root) / (2 * safe_a)), axis=-1)
+    return p1, d, t, counts
+
+
+def batch_line_circle(p1, p2, centers, radii) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Векторный аналог intersection_line_circle для N пар (прямая, окружность).
+    Возвращает (points, counts): точки формы (N, 2, 2) и число точек формы (N,) -
+    NO_HIT (0), TANGENT (1, точка в points[:, 0]) или TWO_HITS (2). Пустые слоты заполнены NaN.
+    """
+    p1, d, t, counts = _line_circle_params(p1, p2, centers, radii)
+    points = p1[..., None, :] + t[..., None] * d[..., None, :]
+    slot = np.arange(2)
+    points[slot >= counts[..., None]] = np.nan
+    return points, counts
+
+
+def batch_segment_circle(seg_p1, seg_p2, centers, radii) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Векторный аналог intersection_segment_circle: из точек пересечения прямой
+    оставляются только лежащие на отрезке (0 <= t <= 1).
+    Возвращает (points, mask): точки формы (N, 2, 2) и маску найденных точек формы (N, 2).
+    Число точек пересечения - mask.sum(axis=-1).
+    """
+    p1, d, t, counts = _line_circle_params(seg_p1, seg_p2, centers, radii)
+    slot = np.arange(2)
+    mask = (slot < counts[..., None]) & (t >= 0) & (t <= 1)
+    points = p1[..., None, :] + t[..., None] * d[..., None, :]
+    points[~mask] = np.nan
+    return points, mask
+
+
+def batch_two_circles(centers1, radii1, centers2, radii2) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Векторный аналог intersection_two_circles для N пар окружностей.
+    Концентрические окружности (d = 0) считаются непересекающимися.
+    Возвращает (points, counts) в том же формате, что batch_line_circle.
+    """
+    centers1, centers2 = _as_points(centers1), _as_points(centers2)
+    r1, r2 = np.asarray(radii1, dtype=np.float64), np.asarray(radii2, dtype=np.float64)
+    delta = centers2 - centers1
+    d = np.hypot(delta[..., 0], delta[..., 1])
+
+    valid = (d > 0) & (d <= r1 + r2) & (d >= np.abs(r1 - r2))
+    safe_d = np.where(valid, d, 1.0)
+    a = (r1 ** 2 - r2 ** 2 + d ** 2) / (2 * safe_d)
+    h_squared = r1 ** 2 - a ** 2
+    counts = np.where(h_squared > 0, TWO_HITS, TANGENT)
+    counts = np.where(valid, counts, NO_HIT).astype(np.int8)
+
+    h = np.sqrt(np.maximum(h_squared, 0.0))
+    unit = delta / safe_d[..., None]
+    middle = centers1 + a[..., None] * unit
+    # Сдвиг на h вдоль нормали (dy, -dx), как xs1, ys1 и xs2, ys2 в intersection_two_circles
+    offset = h[..., None] * np.stack((unit[..., 1], -unit[..., 0]), axis=-1)
+    points = np.stack((middle + offset, middle - offset), axis=-2)
+    slot = np.arange(2)
+    points[slot >= counts[..., None]] = np.nan
+    return points, counts
+
+
+if __name__ == "__main__":
+    # Вертикальная прямая x = 1 и единичная окружность в начале координат - касание в (1, 0)
+    print(batch_line_circle([[1, -5], [0, -5]], [[1, 5], [0, 5]], [[0, 0], [0, 0]], [1, 1]))
+
+    intersections = load_lab_module("2. Intersections.py")
+    rng = np.random.default_rng(0)
+    n = 200_000
+    seg_p1, seg_p2 = rng.uniform(-10, 10, (n, 2)), rng.uniform(-10, 10, (n, 2))
+    centers, radii = rng.uniform(-10, 10, (n, 2)), rng.uniform(0.5, 5, n)
+
+    started = perf_counter()
+    expected = [intersections.intersection_segment_circle(tuple(a), tuple(b), tuple(c), r)
+                for a, b, c, r in zip(seg_p1.tolist(), seg_p2.tolist(), centers.tolist(), radii.tolist())]
+    scalar_time = perf_counter() - started
+
+    started = perf_counter()
+    points, mask = batch_segment_circle(seg_p1, seg_p2, centers, radii)
+    batch_time = perf_counter() - started
+
+    same = all(len(found) == hits for found, hits in zip(expected, mask.sum(axis=-1).tolist()))
+    print(f"{n} segment-circle tests: scalar {n / scalar_time / 1e6:.2f} M/s, "
+          f"batch {n / batch_time / 1e6:.2f} M/s, same hit counts: {same}")
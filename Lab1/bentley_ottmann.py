@@ -0,0 +1,150 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+from itertools import combinations
+from math import inf
+from random import randint
+
+from Lab1.monotone_chain import _cross
+
+
+def _exact(value):
+    """Integers stay integers (fast), everything else becomes an exact Fraction."""
+    return value if isinstance(value, int) else Fraction(value)
+
+
+def _point(p) -> tuple:
+    return _exact(p[0]), _exact(p[1])
+
+
+def _line_intersection(s1, s2):
+    """Intersection point of two segments by the same formulas as intersection_two_lines, exact.
+
+    A = y2 - y1, B = x1 - x2, C = x2*y1 - x1*y2; det = A1*B2 - A2*B1.
+    Returns None for parallel segments and for line intersections outside either segment.
+    """
+    (x1, y1), (x2, y2) = s1
+    (x3, y3), (x4, y4) = s2
+    A1, B1, C1 = y2 - y1, x1 - x2, x2 * y1 - x1 * y2
+    A2, B2, C2 = y4 - y3, x3 - x4, x4 * y3 - x3 * y4
+
+    det = A1 * B2 - A2 * B1
+    if det == 0:
+        return None
+    x = Fraction(B1 * C2 - B2 * C1) / det
+    y = Fraction(A2 * C1 - A1 * C2) / det
+    for (ax, ay), (bx, by) in (s1, s2):
+        if not (min(ax, bx) <= x <= max(ax, bx) and min(ay, by) <= y <= max(ay, by)):
+            return None
+    return x, y
+
+
+def bentley_ottmann(segments, exact: bool = False):
+    """Report all intersections among segments with a sweep line.
+
+    The sweep goes over event points in (x, y) order; the status keeps the segments
+    crossing the sweep line ordered by y just after the current event. Arithmetic is exact
+    (integers or Fractions), so shared endpoints, vertical segments and several segments
+    crossing at one point are handled exactly.
+
+    Each of the O(n + k) events costs O(log n) comparisons and heap operations, but the
+    status is a plain list: removing and re-inserting segments shifts up to n entries,
+    so the worst case is O(n * (n + k)). The shift is a single memmove and is cheap
+    next to the exact arithmetic unless the status holds very many segments at once.
+
+    :param segments: list of ((x1, y1), (x2, y2)).
+    :param exact: yield the point as Fractions instead of floats.
+    :return: generator of (i, j, point) with i < j - indices into segments. Collinear
+             overlapping segments are reported at every event point of the overlap.
+
+    """
+    normalized = []
+    starts = {}
+    degenerate = {}
+    for index, (a, b) in enumerate(segments):
+        a, b = _point(a), _point(b)
+        if b < a:
+            a, b = b, a
+        normalized.append((a, b))
+        (degenerate if a == b else starts).setdefault(a, []).append(index)
+
+    queue = list(set(starts) | set(degenerate) | {b for a, b in normalized})
+    heapq.heapify(queue)
+    scheduled = set(queue)
+    status: list[int] = []
+
+    def side(index, p) -> int:
+        """-1 if the segment passes below p on the line x = p.x, 0 - through p, 1 - above p.
+
+        A vertical segment can only be in the status while the sweep is on its x and
+        before its upper end, so it always passes through p.
+        """
+        a, b = normalized[index]
+        if a[0] == b[0]:
+            return 0
+        cross = _cross(a, b, p)
+        return -1 if cross > 0 else (1 if cross < 0 else 0)
+
+    def slope(index):
+        (x1, y1), (x2, y2) = normalized[index]
+        return inf if x1 == x2 else Fraction(y2 - y1) / (x2 - x1)
+
+    def schedule(first, second, p):
+        point = _line_intersection(normalized[first], normalized[second])
+        if point is not None and point > p and point not in scheduled:
+            scheduled.add(point)
+            heapq.heappush(queue, point)
+
+    while queue:
+        p = heapq.heappop(queue)
+        scheduled.discard(p)
+
+        # Segments in the status that pass through p form a contiguous block with side == 0
+        lo = bisect_left(status, 0, key=lambda index: side(index, p))
+        hi = bisect_right(status, 0, key=lambda index: side(index, p))
+        through = status[lo:hi]
+        upper = starts.get(p, [])
+        # Segments ending at p (L(p)) are dropped, the rest of them (C(p)) are re-inserted
+        containing = [index for index in through if normalized[index][1] != p]
+
+        involved = sorted(upper + through + degenerate.get(p, []))
+        if len(involved) > 1:
+            point = p if exact else (float(p[0]), float(p[1]))
+            for i, j in combinations(involved, 2):
+                yield i, j, point
+
+        # Remove L(p) and C(p), re-insert U(p) and C(p) in their order just after p
+        del status[lo:hi]
+        inserted = sorted(upper + containing, key=slope)
+        status[lo:lo] = inserted
+
+        if not inserted:
+            if 0 < lo < len(status):
+                schedule(status[lo - 1], status[lo], p)
+        else:
+            if lo > 0:
+                schedule(status[lo - 1], inserted[0], p)
+            right = lo + len(inserted)
+            if right < len(status):
+                schedule(inserted[-1], status[right], p)
+
+
+def brute_force_intersections(segments) -> set:
+    """O(n^2) reference: all pairs with a single intersection point (overlaps excluded)."""
+    result = set()
+    normalized = [(_point(a), _point(b)) for a, b in segments]
+    for i, j in combinations(range(len(segments)), 2):
+        point = _line_intersection(normalized[i], normalized[j])
+        if point is not None:
+            result.add((i, j, point))
+    return result
+
+
+if __name__ == "__main__":
+    example = [((1, 1), (2, 2)), ((2, 1), (1, 2)), ((1.5, 0), (1.5, 3)), ((0, 1), (3, 1))]
+    for found in bentley_ottmann(example):
+        print(found)
+
+    random_segments = [((randint(0, 50), randint(0, 50)), (randint(0, 50), randint(0, 50))) for _ in range(60)]
+    sweep = {(i, j, p) for i, j, p in bentley_ottmann(random_segments, exact=True)}
+    print(len(sweep), brute_force_intersections(random_segments) <= sweep)
@@ -0,0 +1,84 @@
+from bisect import bisect_left
+from random import randint
+
+from Lab1.monotone_chain import _cross
+
+
+class DynamicHull:
+    """Incremental convex hull for a stream of points.
+
+    The hull is kept as two chains sorted lexicographically by (x, y), both running from
+    the lowest-leftmost to the highest-rightmost point: the lower chain turns left at every
+    vertex and the upper chain turns right. A new point is located by binary search,
+    inserted if it is outside, and the neighbours it makes non-convex are removed.
+    Points inside the hull are never stored, so memory follows the hull size.
+    """
+
+    def __init__(self, points=()):
+        """Seed the structure, e.g. with the output of graham_scan."""
+        self.lower: list[tuple[int, int]] = []
+        self.upper: list[tuple[int, int]] = []
+        self.insert_many(points)
+
+    @staticmethod
+    def _is_outside(chain: list, point: tuple, sign: int) -> bool:
+        """True if point lies strictly outside the half-plane region bounded by the chain."""
+        i = bisect_left(chain, point)
+        if i < len(chain) and chain[i] == point:
+            return False
+        if i == 0 or i == len(chain):
+            return True
+        return sign * _cross(chain[i - 1], point, chain[i]) > 0
+
+    @staticmethod
+    def _insert(chain: list, point: tuple, sign: int) -> bool:
+        if not DynamicHull._is_outside(chain, point, sign):
+            return False
+        i = bisect_left(chain, point)
+        chain.insert(i, point)
+        # Remove neighbours on the left that no longer make a convex turn
+        while i >= 2 and sign * _cross(chain[i - 2], chain[i - 1], point) <= 0:
+            del chain[i - 1]
+            i -= 1
+        # And the same on the right
+        while i + 2 < len(chain) and sign * _cross(point, chain[i + 1], chain[i + 2]) <= 0:
+            del chain[i + 1]
+        return True
+
+    def insert(self, point: tuple[int, int]) -> bool:
+        """Add a point; return True if it became a hull vertex."""
+        point = (point[0], point[1])
+        added_lower = self._insert(self.lower, point, 1)
+        added_upper = self._insert(self.upper, point, -1)
+        return added_lower or added_upper
+
+    def insert_many(self, points) -> int:
+        """Add a batch of points; return how many of them became hull vertices."""
+        return sum(self.insert(point) for point in points)
+
+    def __contains__(self, point: tuple[int, int]) -> bool:
+        """Point-in-hull test, the boundary counts as inside."""
+        if not self.lower:
+            return False
+        point = (point[0], point[1])
+        return not self._is_outside(self.lower, point, 1) and not self._is_outside(self.upper, point, -1)
+
+    def vertices(self) -> list[tuple[int, int]]:
+        """Hull vertices counter-clockwise from the lowest (then leftmost) point, as graham_scan returns them."""
+        hull = self.lower[:-1] + self.upper[:0:-1]
+        if not hull:
+            return list(self.lower)
+        start = min(range(len(hull)), key=lambda i: (hull[i][1], hull[i][0]))
+        return hull[start:] + hull[:start]
+
+    def __len__(self):
+        return len(self.vertices())
+
+
+if __name__ == "__main__":
+    hull = DynamicHull([(0, 0), (10, 0), (10, 10), (0, 10)])
+    print(hull.vertices(), (5, 5) in hull, (11, 5) in hull)
+    for _ in range(10):
+        batch = [(randint(-15, 25), randint(-15, 25)) for _ in range(20)]
+        hull.insert_many(batch)
+    print(hull.vertices())
@@ -0,0 +1,19 @@
+import importlib.util
+import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def load_lab_module(file_name: str):
+    """
+    Импорт файла лабораторной вроде '1. Graham.py' или '2. Intersections.py':
+    имя файла не является именем модуля, поэтому он загружается через importlib.
+    Модуль загружается один раз и кэшируется.
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), file_name)
+    # '2. Intersections.py' -> 'intersections'
+    name = os.path.splitext(file_name)[0].split(". ")[-1].lower()
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
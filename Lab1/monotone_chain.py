@@ -0,0 +1,102 @@
+from random import randint
+from time import perf_counter
+
+import numpy as np
+
+
+def _cross(o, a, b) -> int:
+    """Return the cross product of vectors OA and OB (> 0 - left turn, < 0 - right turn)."""
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _interior_mask(points: np.ndarray) -> np.ndarray:
+    """Akl-Toussaint heuristic: mark points strictly inside the polygon of extreme points.
+
+    The extreme points in the directions x, y, x + y and x - y lie on the hull,
+    so everything strictly inside their polygon can be dropped before the main pass.
+    Integer coordinates are shifted to start at zero; if their span exceeds 2 ** 31,
+    the int64 cross products could overflow, so the filter is skipped (nothing is marked).
+    """
+    inside = np.zeros(len(points), dtype=bool)
+    if np.issubdtype(points.dtype, np.integer):
+        low, high = points.min(axis=0), points.max(axis=0)
+        if max(int(high[0]) - int(low[0]), int(high[1]) - int(low[1])) > 2 ** 31:
+            return inside
+        points = points.astype(np.int64) - low.astype(np.int64)
+    x, y = points[:, 0], points[:, 1]
+    # Support points in counter-clockwise order of direction: left, bottom-left, bottom, ...
+    extremes = [np.argmin(x), np.argmin(x + y), np.argmin(y), np.argmax(x - y),
+                np.argmax(x), np.argmax(x + y), np.argmax(y), np.argmin(x - y)]
+    polygon = []
+    for index in extremes:
+        vertex = (points[index, 0], points[index, 1])
+        if not polygon or (vertex != polygon[-1] and vertex != polygon[0]):
+            polygon.append(vertex)
+
+    if len(polygon) < 3:
+        return inside
+    inside[:] = True
+    for i in range(len(polygon)):
+        (x1, y1), (x2, y2) = polygon[i], polygon[(i + 1) % len(polygon)]
+        inside &= (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1) > 0
+    return inside
+
+
+def monotone_chain(points) -> np.ndarray:
+    """Andrew's monotone chain convex hull over an (N, 2) array.
+
+    Sorting, deduplication and interior filtering are vectorised with NumPy; the chain
+    pass itself uses exact Python integer cross products for integer input.
+    Collinear points on hull edges are dropped, as in graham_scan.
+
+    :param points: (N, 2) array-like of coordinates.
+    :return: indices into points of the hull vertices, counter-clockwise, starting
+             from the lowest (then leftmost) point - the same order graham_scan returns.
+
+    """
+    points = np.asarray(points)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError("monotone_chain: points must be an (N, 2) array.")
+    if len(points) <= 2:
+        raise ValueError("monotone_chain: argument must contain more than 3 points.")
+
+    # Lexicographic sort by (x, y) and removal of duplicate points
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    sorted_points = points[order]
+    unique = np.ones(len(order), dtype=bool)
+    unique[1:] = np.any(sorted_points[1:] != sorted_points[:-1], axis=1)
+    order, sorted_points = order[unique], sorted_points[unique]
+
+    candidates = ~_interior_mask(sorted_points)
+    order = order[candidates]
+    coordinates = sorted_points[candidates].tolist()
+    if len(order) < 3:
+        return order
+
+    def half_hull(indices):
+        chain = []
+        for i in indices:
+            while len(chain) >= 2 and _cross(coordinates[chain[-2]], coordinates[chain[-1]], coordinates[i]) <= 0:
+                chain.pop()
+            chain.append(i)
+        return chain
+
+    lower = half_hull(range(len(order)))
+    upper = half_hull(range(len(order) - 1, -1, -1))
+    hull = order[lower[:-1] + upper[:-1]]
+
+    # Start from the lowest and then leftmost point, like graham_scan
+    hull_points = points[hull]
+    start = np.lexsort((hull_points[:, 0], hull_points[:, 1]))[0]
+    return np.roll(hull, -start)
+
+
+if __name__ == "__main__":
+    example_points = [(randint(0, 100), randint(0, 100)) for x in range(0, 50)]
+    hull_indices = monotone_chain(example_points)
+    print([example_points[i] for i in hull_indices])
+
+    big_cloud = np.random.default_rng(0).integers(-10 ** 6, 10 ** 6, size=(1_000_000, 2))
+    started = perf_counter()
+    hull_indices = monotone_chain(big_cloud)
+    print(f"{len(big_cloud)} points -> {len(hull_indices)} hull vertices in {perf_counter() - started:.3f} s")
@@ -0,0 +1,78 @@
+import os
+from multiprocessing import Pool
+from time import perf_counter
+
+import numpy as np
+
+from Lab1.lab_modules import load_lab_module
+from Lab1.monotone_chain import monotone_chain
+
+CHUNK_POINTS = 1 << 20
+
+
+def _hull_candidates(points: np.ndarray) -> np.ndarray:
+    """Hull vertices of one chunk; these are the only points that can be on the global hull."""
+    if len(points) < 3:
+        return points
+    return points[monotone_chain(points)]
+
+
+def _file_chunk_hull(args) -> np.ndarray:
+    path, dtype, start, stop = args
+    # Each worker maps only its own slice of the file, the points never cross process boundaries
+    cloud = np.memmap(path, dtype=dtype, mode="r").reshape(-1, 2)
+    return _hull_candidates(np.asarray(cloud[start:stop]))
+
+
+def _merge(candidates) -> list[tuple[int, int]]:
+    merged = np.concatenate(list(candidates))
+    hull = merged[monotone_chain(merged)]
+    return [tuple(point) for point in hull.tolist()]
+
+
+def parallel_hull(points, processes: int = None, chunk_points: int = CHUNK_POINTS) -> list[tuple[int, int]]:
+    """Divide-and-conquer convex hull: chunk hulls in a process pool, then one final pass.
+
+    :param points: (N, 2) array-like of coordinates.
+    :return: the same hull as graham_scan - counter-clockwise from the lowest, then leftmost point.
+
+    """
+    points = np.asarray(points)
+    if len(points) <= 2:
+        raise ValueError("parallel_hull: argument must contain more than 3 points.")
+    chunks = [points[start:start + chunk_points] for start in range(0, len(points), chunk_points)]
+    if len(chunks) == 1:
+        return _merge([_hull_candidates(points)])
+    with Pool(processes) as pool:
+        return _merge(pool.imap_unordered(_hull_candidates, chunks))
+
+
+def parallel_hull_file(path: str, dtype=np.int64, processes: int = None,
+                       chunk_points: int = CHUNK_POINTS) -> list[tuple[int, int]]:
+    """Hull of a binary file of (x, y) pairs of the given dtype, e.g. written by ndarray.tofile.
+
+    Workers read their chunks lazily through np.memmap; only offsets go to the workers
+    and only chunk hull vertices come back.
+    """
+    total = os.path.getsize(path) // (2 * np.dtype(dtype).itemsize)
+    if total <= 2:
+        raise ValueError("parallel_hull_file: file must contain more than 3 points.")
+    tasks = [(path, dtype, start, min(start + chunk_points, total)) for start in range(0, total, chunk_points)]
+    with Pool(processes) as pool:
+        return _merge(pool.imap_unordered(_file_chunk_hull, tasks))
+
+
+if __name__ == "__main__":
+    graham_scan = load_lab_module("1. Graham.py").graham_scan
+    cloud = np.random.default_rng(0).integers(-10 ** 6, 10 ** 6, size=(2_000_000, 2))
+
+    started = perf_counter()
+    expected = graham_scan([tuple(point) for point in cloud.tolist()])
+    graham_time = perf_counter() - started
+
+    started = perf_counter()
+    result = parallel_hull(cloud, chunk_points=250_000)
+    parallel_time = perf_counter() - started
+
+    print(f"graham_scan: {graham_time:.3f} s, parallel_hull: {parallel_time:.3f} s, "
+          f"speedup x{graham_time / parallel_time:.1f}, same hull: {result == expected}")
@@ -0,0 +1,198 @@
+from heapq import merge
+from math import atan2, dist, pi
+from random import randint
+
+from Lab1.monotone_chain import _cross, monotone_chain
+
+
+def _strict_hull(hull: list) -> list:
+    """Drop repeated and collinear vertices of a convex polygon in O(h).
+
+    graham_scan keeps its first three points without a turn check, so its output may
+    have a vertex in the middle of an edge; the calipers below only advance on a strict
+    increase and would stop at such a vertex. A fully collinear input collapses to its
+    two extreme points.
+    """
+    hull = list(dict.fromkeys(map(tuple, hull)))
+    h = len(hull)
+    if h < 3:
+        return hull
+    strict = [p for i, p in enumerate(hull) if _cross(hull[i - 1], p, hull[(i + 1) % h]) != 0]
+    if len(strict) < 3:
+        return [min(hull), max(hull)]
+    return strict
+
+
+def diameter(hull: list[tuple[int, int]]) -> tuple[float, tuple]:
+    """Farthest pair of points of a convex polygon in O(h).
+
+    :param hull: hull vertices counter-clockwise, as graham_scan or monotone_chain return them;
+                 collinear and repeated vertices are dropped first.
+    :return: (distance, (p, q)).
+
+    """
+    hull = _strict_hull(hull)
+    h = len(hull)
+    if h == 1:
+        return 0.0, (hull[0], hull[0])
+    if h == 2:
+        return dist(hull[0], hull[1]), (hull[0], hull[1])
+
+    best = (0.0, (hull[0], hull[0]))
+    j = 1
+    for i in range(h):
+        ni = (i + 1) % h
+        # Move the opposite caliper while the triangle area over edge (i, ni) grows
+        while _cross(hull[i], hull[ni], hull[(j + 1) % h]) > _cross(hull[i], hull[ni], hull[j]):
+            j = (j + 1) % h
+        for p in (hull[i], hull[ni]):
+            distance = dist(p, hull[j])
+            if distance > best[0]:
+                best = (distance, (p, hull[j]))
+    return best
+
+
+def width(hull: list[tuple[int, int]]) -> tuple[float, tuple]:
+    """Minimum width of a convex polygon in O(h).
+
+    :return: (width, (edge start, edge end, farthest vertex from that edge)).
+
+    """
+    hull = _strict_hull(hull)
+    h = len(hull)
+    if h < 3:
+        return 0.0, tuple(hull)
+
+    best = None
+    j = 1
+    for i in range(h):
+        ni = (i + 1) % h
+        while _cross(hull[i], hull[ni], hull[(j + 1) % h]) > _cross(hull[i], hull[ni], hull[j]):
+            j = (j + 1) % h
+        height = _cross(hull[i], hull[ni], hull[j]) / dist(hull[i], hull[ni])
+        if best is None or height < best[0]:
+            best = (height, (hull[i], hull[ni], hull[j]))
+    return best
+
+
+def min_area_rectangle(hull: list[tuple[int, int]]) -> tuple[float, list[tuple[float, float]]]:
+    """Minimum-area bounding rectangle in O(h); one of its sides lies on a hull edge.
+
+    :return: (area, four corners counter-clockwise).
+
+    """
+    hull = _strict_hull(hull)
+    h = len(hull)
+    if h < 3:
+        return 0.0, [tuple(map(float, p)) for p in hull]
+
+    def dot(i, ex, ey, origin):
+        return ex * (hull[i][0] - origin[0]) + ey * (hull[i][1] - origin[1])
+
+    best = None
+    right = top = left = 1
+    for i in range(h):
+        p, q = hull[i], hull[(i + 1) % h]
+        ex, ey = q[0] - p[0], q[1] - p[1]
+        # Three calipers: farthest along the edge, farthest from the edge, farthest against the edge
+        while dot((right + 1) % h, ex, ey, p) > dot(right, ex, ey, p):
+            right = (right + 1) % h
+        if i == 0:
+            top = right
+        while _cross(p, q, hull[(top + 1) % h]) > _cross(p, q, hull[top]):
+            top = (top + 1) % h
+        if i == 0:
+            left = top
+        while dot((left + 1) % h, ex, ey, p) < dot(left, ex, ey, p):
+            left = (left + 1) % h
+
+        length_sq = ex * ex + ey * ey
+        low, high = dot(left, ex, ey, p), dot(right, ex, ey, p)
+        height = _cross(p, q, hull[top])
+        area = (high - low) * height / length_sq
+        if best is None or area < best[0]:
+            # Corners in edge coordinates: along the edge (low..high), across it (0..height)
+            corners = []
+            for along, across in ((low, 0), (high, 0), (high, height), (low, height)):
+                corners.append((p[0] + (along * ex - across * ey) / length_sq,
+                                p[1] + (along * ey + across * ex) / length_sq))
+            best = (area, corners)
+    return best
+
+
+def _support_events(hull: list, shift: float) -> tuple[int, list]:
+    """Start vertex and sorted (angle, vertex) events where the support vertex changes.
+
+    The support vertex of a counter-clockwise polygon in direction theta changes from
+    vertex i to i + 1 when theta passes the outward normal of edge (i, i + 1).
+    """
+    h = len(hull)
+    events = []
+    for i in range(h):
+        p, q = hull[i], hull[(i + 1) % h]
+        angle = atan2(-(q[0] - p[0]), q[1] - p[1]) + shift
+        angle = (angle + pi) % (2 * pi) - pi
+        events.append((angle, (i + 1) % h))
+    # Normal angles already go round in order, so a rotation sorts them in O(h)
+    first = min(range(h), key=lambda i: events[i][0])
+    events = events[first:] + events[:first]
+    return first, events
+
+
+def max_distance_between(hull_a: list, hull_b: list) -> tuple[float, tuple]:
+    """Maximum distance between two convex polygons in O(h_a + h_b).
+
+    The farthest pair (a, b) consists of a support vertex of A in some direction and
+    a support vertex of B in the opposite one, so both polygons are swept together.
+    """
+    if len(hull_a) < 2 or len(hull_b) < 2:
+        return max((dist(a, b), (a, b)) for a in hull_a for b in hull_b)
+
+    support_a, events_a = _support_events(hull_a, 0.0)
+    support_b, events_b = _support_events(hull_b, -pi)
+    tagged_a = ((angle, 0, vertex) for angle, vertex in events_a)
+    tagged_b = ((angle, 1, vertex) for angle, vertex in events_b)
+
+    best = (dist(hull_a[support_a], hull_b[support_b]), (hull_a[support_a], hull_b[support_b]))
+    previous = [support_a, support_b]
+    current = [support_a, support_b]
+    for _, polygon, vertex in merge(tagged_a, tagged_b):
+        previous[polygon] = current[polygon]
+        current[polygon] = vertex
+        # Also check mixed pairs, in case both polygons have parallel edges at this angle
+        for i in (current[0], previous[0]):
+            for j in (current[1], previous[1]):
+                distance = dist(hull_a[i], hull_b[j])
+                if distance > best[0]:
+                    best = (distance, (hull_a[i], hull_b[j]))
+    return best
+
+
+def calipers_batch(point_sets) -> list[dict]:
+    """Hull, diameter, width and minimum bounding rectangle for many small point sets."""
+    result = []
+    for points in point_sets:
+        points = list(points)
+        if len(points) <= 2:
+            hull = list(dict.fromkeys(map(tuple, points)))
+        else:
+            hull = [tuple(points[i]) for i in monotone_chain(points)]
+        result.append({
+            "hull": hull,
+            "diameter": diameter(hull)[0],
+            "width": width(hull)[0],
+            "min_rectangle_area": min_area_rectangle(hull)[0],
+        })
+    return result
+
+
+if __name__ == "__main__":
+    square = [(0, 0), (4, 0), (4, 4), (0, 4)]
+    print(diameter(square), width(square), min_area_rectangle(square)[0])
+    print(max_distance_between(square, [(10, 10), (12, 10), (11, 12)]))
+    # graham_scan may keep a vertex in the middle of the first edge: (3, 0) here
+    with_collinear = [(2, 0), (3, 0), (6, 0), (6, 1), (4, 6), (0, 6)]
+    print(diameter(with_collinear), width(with_collinear))
+    clouds = [[(randint(0, 100), randint(0, 100)) for _ in range(20)] for _ in range(3)]
+    for stats in calipers_batch(clouds):
+        print(stats)
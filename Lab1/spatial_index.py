@@ -0,0 +1,287 @@
+import math
+from itertools import count
+from random import uniform
+from time import perf_counter
+
+from Lab1.lab_modules import load_lab_module
+
+NODE_CAPACITY = 16
+REBUILD_RATIO = 0.25
+
+
+def segment_bbox(p1, p2) -> tuple[float, float, float, float]:
+    """Ограничивающий прямоугольник отрезка (x_min, y_min, x_max, y_max)."""
+    return min(p1[0], p2[0]), min(p1[1], p2[1]), max(p1[0], p2[0]), max(p1[1], p2[1])
+
+
+def circle_bbox(center, radius) -> tuple[float, float, float, float]:
+    """Ограничивающий квадрат окружности (x_min, y_min, x_max, y_max)."""
+    return center[0] - radius, center[1] - radius, center[0] + radius, center[1] + radius
+
+
+def _overlaps(a, b) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _union(boxes) -> tuple[float, float, float, float]:
+    boxes = list(boxes)
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+
+class UniformGrid:
+    """
+    Равномерная сетка: каждый объект записывается во все ячейки, которые задевает его прямоугольник.
+    Вставка и удаление - O(число ячеек объекта), запрос - перебор ячеек прямоугольника запроса.
+    Хороша, когда объекты примерно одного размера и размер ячейки сравним с ними.
+    """
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError("UniformGrid: cell_size must be positive.")
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], set] = {}
+        self.boxes: dict = {}
+
+    def _cell_range(self, bbox):
+        size = self.cell_size
+        for i in range(math.floor(bbox[0] / size), math.floor(bbox[2] / size) + 1):
+            for j in range(math.floor(bbox[1] / size), math.floor(bbox[3] / size) + 1):
+                yield i, j
+
+    def insert(self, item_id, bbox) -> None:
+        if item_id in self.boxes:
+            self.remove(item_id)
+        self.boxes[item_id] = bbox
+        for cell in self._cell_range(bbox):
+            self.cells.setdefault(cell, set()).add(item_id)
+
+    def remove(self, item_id) -> None:
+        bbox = self.boxes.pop(item_id)
+        for cell in self._cell_range(bbox):
+            bucket = self.cells[cell]
+            bucket.discard(item_id)
+            if not bucket:
+                del self.cells[cell]
+
+    def query(self, bbox) -> set:
+        """Идентификаторы объектов, чьи прямоугольники пересекают bbox."""
+        found = set()
+        for cell in self._cell_range(bbox):
+            found.update(self.cells.get(cell, ()))
+        return {item_id for item_id in found if _overlaps(self.boxes[item_id], bbox)}
+
+    def __len__(self):
+        return len(self.boxes)
+
+
+class STRTree:
+    """
+    R-дерево, упакованное методом Sort-Tile-Recursive: объекты сортируются по x, режутся
+    на вертикальные полосы, внутри полосы сортируются по y и группируются по NODE_CAPACITY.
+    Упакованное дерево статично, поэтому вставки копятся в буфере, а удаления - в множестве
+    удалённых; когда их доля превышает REBUILD_RATIO, дерево перестраивается целиком.
+    Повторная вставка уже упакованного объекта тоже помечает его лист удалённым: пометка
+    живёт до перестройки, а актуальный прямоугольник лежит в буфере.
+    Буфер просматривается линейно, поэтому запрос перестраивает дерево, если в буфере
+    больше node_capacity ** 2 объектов.
+    """
+
+    def __init__(self, node_capacity: int = NODE_CAPACITY, rebuild_ratio: float = REBUILD_RATIO):
+        self.node_capacity = node_capacity
+        self.rebuild_ratio = rebuild_ratio
+        self.boxes: dict = {}
+        self.root = None
+        self.packed = 0
+        self.pending: dict = {}
+        self.removed: set = set()
+
+    def _pack_level(self, level: list) -> list:
+        """Один уровень STR: список (bbox, потомок) -> список узлов (bbox, потомки)."""
+        capacity = self.node_capacity
+        nodes_count = math.ceil(len(level) / capacity)
+        slices = math.ceil(math.sqrt(nodes_count))
+        slice_size = slices * capacity
+
+        level = sorted(level, key=lambda entry: entry[0][0] + entry[0][2])
+        packed = []
+        for start in range(0, len(level), slice_size):
+            vertical = sorted(level[start:start + slice_size], key=lambda entry: entry[0][1] + entry[0][3])
+            for group_start in range(0, len(vertical), capacity):
+                group = vertical[group_start:group_start + capacity]
+                packed.append((_union(box for box, _ in group), group))
+        return packed
+
+    def rebuild(self) -> None:
+        """Упаковать все живые объекты заново."""
+        self.pending.clear()
+        self.removed.clear()
+        self.packed = len(self.boxes)
+        if not self.boxes:
+            self.root = None
+            return
+        # Листья хранят (bbox, item_id), внутренние узлы - (bbox, [дочерние узлы])
+        level = self._pack_level([(bbox, item_id) for item_id, bbox in self.boxes.items()])
+        height = 1
+        while len(level) > 1:
+            level = self._pack_level(level)
+            height += 1
+        self.root = (level[0], height)
+
+    def _maybe_rebuild(self) -> None:
+        if len(self.pending) + len(self.removed) > self.rebuild_ratio * max(self.packed, self.node_capacity):
+            self.rebuild()
+
+    def insert(self, item_id, bbox) -> None:
+        if item_id in self.boxes and item_id not in self.pending:
+            # Лист со старым прямоугольником остаётся в дереве до перестройки
+            self.removed.add(item_id)
+        self.boxes[item_id] = bbox
+        self.pending[item_id] = bbox
+        self._maybe_rebuild()
+
+    def remove(self, item_id) -> None:
+        del self.boxes[item_id]
+        if self.pending.pop(item_id, None) is None:
+            self.removed.add(item_id)
+        self._maybe_rebuild()
+
+    def query(self, bbox) -> set:
+        """Идентификаторы объектов, чьи прямоугольники пересекают bbox."""
+        if len(self.pending) > self.node_capacity ** 2:
+            self.rebuild()
+        found = {item_id for item_id, box in self.pending.items() if _overlaps(box, bbox)}
+        if self.root is None:
+            return found
+        (root_box, root_children), height = self.root
+        stack = [(root_box, root_children, height)]
+        while stack:
+            box, children, depth = stack.pop()
+            if not _overlaps(box, bbox):
+                continue
+            if depth == 1:
+                found.update(item_id for child_box, item_id in children
+                             if item_id not in self.removed and _overlaps(child_box, bbox))
+            else:
+                stack.extend((child_box, child_children, depth - 1) for child_box, child_children in children)
+        return found
+
+    def __len__(self):
+        return len(self.boxes)
+
+
+BACKENDS = {
+    "grid": UniformGrid,
+    "rtree": STRTree,
+}
+
+
+class SpatialIndex:
+    """
+    Пространственный индекс отрезков и окружностей для запросов "многие ко многим".
+    Пары отсекаются по ограничивающим прямоугольникам, и только оставшиеся кандидаты
+    передаются точной функции intersection_segment_circle.
+
+    :param backend: "grid" (нужен cell_size) или "rtree".
+    """
+
+    def __init__(self, backend: str = "rtree", **options):
+        if backend not in BACKENDS:
+            raise ValueError(f"SpatialIndex: unknown backend {backend!r}, expected one of {sorted(BACKENDS)}.")
+        self.backend = backend
+        self.segments: dict[int, tuple] = {}
+        self.circles: dict[int, tuple] = {}
+        self.segment_index = BACKENDS[backend](**options)
+        self.circle_index = BACKENDS[backend](**options)
+        self.stats: dict = {}
+        self._ids = count()
+
+    def insert_segment(self, p1, p2) -> int:
+        """Добавить отрезок, вернуть его идентификатор."""
+        segment_id = next(self._ids)
+        self.segments[segment_id] = (tuple(p1), tuple(p2))
+        self.segment_index.insert(segment_id, segment_bbox(p1, p2))
+        return segment_id
+
+    def insert_circle(self, center, radius: float) -> int:
+        """Добавить окружность, вернуть её идентификатор."""
+        circle_id = next(self._ids)
+        self.circles[circle_id] = (tuple(center), radius)
+        self.circle_index.insert(circle_id, circle_bbox(center, radius))
+        return circle_id
+
+    def remove_segment(self, segment_id: int) -> None:
+        del self.segments[segment_id]
+        self.segment_index.remove(segment_id)
+
+    def remove_circle(self, circle_id: int) -> None:
+        del self.circles[circle_id]
+        self.circle_index.remove(circle_id)
+
+    def query_circle(self, center, radius: float) -> list[tuple[int, list]]:
+        """Отрезки, пересекающие окружность: [(segment_id, точки пересечения), ...]."""
+        intersection_segment_circle = load_lab_module("2. Intersections.py").intersection_segment_circle
+        result = []
+        for segment_id in self.segment_index.query(circle_bbox(center, radius)):
+            points = intersection_segment_circle(*self.segments[segment_id], center, radius)
+            if points:
+                result.append((segment_id, points))
+        return result
+
+    def intersections(self) -> list[tuple[int, int, list]]:
+        """
+        Все пересечения отрезков с окружностями: [(circle_id, segment_id, точки), ...].
+        Меньшее из множеств перебирается, большее - опрашивается через индекс.
+        Статистика отсечения сохраняется в self.stats.
+        """
+        intersection_segment_circle = load_lab_module("2. Intersections.py").intersection_segment_circle
+        result = []
+        candidates = 0
+        if len(self.circles) <= len(self.segments):
+            for circle_id, (center, radius) in self.circles.items():
+                for segment_id in self.segment_index.query(circle_bbox(center, radius)):
+                    candidates += 1
+                    points = intersection_segment_circle(*self.segments[segment_id], center, radius)
+                    if points:
+                        result.append((circle_id, segment_id, points))
+        else:
+            for segment_id, (p1, p2) in self.segments.items():
+                for circle_id in self.circle_index.query(segment_bbox(p1, p2)):
+                    candidates += 1
+                    center, radius = self.circles[circle_id]
+                    points = intersection_segment_circle(p1, p2, center, radius)
+                    if points:
+                        result.append((circle_id, segment_id, points))
+
+        pairs = len(self.circles) * len(self.segments)
+        self.stats = {
+            "pairs": pairs,
+            "candidates": candidates,
+            "hits": len(result),
+            "pruning_ratio": 1 - candidates / pairs if pairs else 0.0,
+        }
+        return result
+
+
+if __name__ == "__main__":
+    def random_segment():
+        x, y = uniform(0, 1000), uniform(0, 1000)
+        return (x, y), (x + uniform(-5, 5), y + uniform(-5, 5))
+
+    segments = [random_segment() for _ in range(100_000)]
+    circles = [((uniform(0, 1000), uniform(0, 1000)), uniform(1, 10)) for _ in range(2_000)]
+
+    for backend, options in (("grid", {"cell_size": 10.0}), ("rtree", {})):
+        started = perf_counter()
+        index = SpatialIndex(backend, **options)
+        segment_ids = [index.insert_segment(p1, p2) for p1, p2 in segments]
+        for center, radius in circles:
+            index.insert_circle(center, radius)
+        built = perf_counter()
+        found = index.intersections()
+        print(f"{backend}: build {built - started:.2f} s, query {perf_counter() - built:.2f} s, "
+              f"{len(found)} hits, pruned {index.stats['pruning_ratio']:.4%} of {index.stats['pairs']} pairs")
+
+        for segment_id in segment_ids[::2]:
+            index.remove_segment(segment_id)
+        print(f"{backend}: after removing half of the segments - {len(index.intersections())} hits")
@@ -0,0 +1,206 @@
+import json
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from collections import deque
+from itertools import islice
+
+MAGIC = b"ACAUTO02"
+TABLES = ("edge_start", "edge_symbol", "edge_target", "fail", "terminal", "dict_link")
+
+
+class CompiledAhoCorasick:
+    """Автомат Ахо-Корасик, скомпилированный в плоские целочисленные таблицы
+
+    Рёбра бора хранятся сжато (CSR): рёбра вершины state занимают отрезок
+    edge_start[state]:edge_start[state + 1] в edge_symbol/edge_target и отсортированы по символу.
+    fail[state] - суффиксная ссылка, по ней идём, если ребра по символу нет;
+    только у корня переходы развёрнуты в плотную строку root_delta.
+    terminal[state] - индекс шаблона, оканчивающегося в вершине (или -1),
+    dict_link[state] - ближайшая терминальная вершина по цепочке суффиксных ссылок (или -1).
+    Символ 0 зарезервирован под все символы, которых нет ни в одном шаблоне.
+    Память - O(states) целых, а не O(states * размер алфавита), как у плотной таблицы переходов.
+    """
+
+    def __init__(self, alphabet: dict, patterns: list, edge_start, edge_symbol, edge_target,
+                 fail, terminal, dict_link):
+        self.alphabet = alphabet
+        self.width = len(alphabet) + 1
+        self.patterns = patterns
+        self.edge_start = edge_start
+        self.edge_symbol = edge_symbol
+        self.edge_target = edge_target
+        self.fail = fail
+        self.terminal = terminal
+        self.dict_link = dict_link
+        self.root_delta = array("i", [0]) * self.width
+        for edge in range(edge_start[0], edge_start[1]):
+            self.root_delta[edge_symbol[edge]] = edge_target[edge]
+
+    @property
+    def states(self) -> int:
+        return len(self.terminal)
+
+    def _goto(self, state: int, symbol: int) -> int:
+        """Переход по символу с учётом суффиксных ссылок"""
+        edge_start, edge_symbol, fail = self.edge_start, self.edge_symbol, self.fail
+        while state:
+            lo, hi = edge_start[state], edge_start[state + 1]
+            edge = bisect_left(edge_symbol, symbol, lo, hi)
+            if edge < hi and edge_symbol[edge] == symbol:
+                return self.edge_target[edge]
+            state = fail[state]
+        return self.root_delta[symbol]
+
+    def search(self, text, limit=None) -> list[tuple[int, str]]:
+        """Возвращает список (позиция, шаблон) в том же порядке, что и search_aho_corasick"""
+        return list(islice(self.iter_search(text), limit))
+
+    def iter_search(self, text):
+        """Лениво выдаёт (позиция, шаблон) по мере прохода по тексту"""
+        alphabet = self.alphabet
+        edge_start = self.edge_start
+        edge_symbol = self.edge_symbol
+        edge_target = self.edge_target
+        fail = self.fail
+        root_delta = self.root_delta
+        terminal = self.terminal
+        dict_link = self.dict_link
+        patterns = self.patterns
+
+        state = 0
+        for i, char in enumerate(text):
+            symbol = alphabet.get(char, 0)
+            if not symbol:
+                # Символа нет ни в одном шаблоне - возвращаемся в корень
+                state = 0
+                continue
+            while state:
+                lo, hi = edge_start[state], edge_start[state + 1]
+                edge = bisect_left(edge_symbol, symbol, lo, hi)
+                if edge < hi and edge_symbol[edge] == symbol:
+                    state = edge_target[edge]
+                    break
+                state = fail[state]
+            else:
+                state = root_delta[symbol]
+            # Обходим только терминальные вершины по словарным ссылкам
+            node = state if terminal[state] != -1 else dict_link[state]
+            while node != -1:
+                pattern = patterns[terminal[node]]
+                yield i - len(pattern) + 1, pattern
+                node = dict_link[node]
+
+    def save(self, path: str):
+        """Сохраняет автомат в файл, который потом можно загрузить через mmap"""
+        header = json.dumps({
+            "alphabet": list(self.alphabet),
+            "patterns": self.patterns,
+            "states": self.states,
+            "edges": len(self.edge_symbol),
+        }).encode("utf-8")
+        # Выравниваем таблицы по 4 байтам, чтобы memoryview.cast('i') работал без копирования
+        padding = b"\0" * (-(len(MAGIC) + 8 + len(header)) % 4)
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            f.write(padding)
+            for name in TABLES:
+                f.write(array("i", getattr(self, name)).tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> "CompiledAhoCorasick":
+        """Загружает автомат, таблицы остаются отображёнными в память"""
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path}: not a compiled Aho-Corasick automaton.")
+        (header_len,) = struct.unpack_from("<Q", mm, len(MAGIC))
+        start = len(MAGIC) + 8
+        header = json.loads(mm[start:start + header_len].decode("utf-8"))
+        start += header_len
+        start += -start % 4
+
+        states, edges = header["states"], header["edges"]
+        tables = memoryview(mm)[start:].cast("i")
+        sizes = (states + 1, edges, edges, states, states, states)
+        views = []
+        for size in sizes:
+            views.append(tables[:size])
+            tables = tables[size:]
+
+        alphabet = {char: symbol for symbol, char in enumerate(header["alphabet"], start=1)}
+        return cls(alphabet, header["patterns"], *views)
+
+    def __getstate__(self):
+        # memoryview из mmap не сериализуется pickle, поэтому копируем в array
+        state = self.__dict__.copy()
+        for name in TABLES:
+            state[name] = array("i", state[name])
+        return state
+
+
+def compile_aho_corasick(patterns) -> CompiledAhoCorasick:
+    """Строит автомат сразу в плоские таблицы, без вершин-объектов и копирования output"""
+    patterns = list(dict.fromkeys(pattern for pattern in patterns if pattern))
+
+    alphabet = {}
+    for pattern in patterns:
+        for char in pattern:
+            if char not in alphabet:
+                alphabet[char] = len(alphabet) + 1
+    width = len(alphabet) + 1
+
+    # Шаг 1: Построение бора в одном словаре state * width + symbol -> вершина
+    trie = {}
+    terminal = array("i", [-1])
+    for index, pattern in enumerate(patterns):
+        state = 0
+        for char in pattern:
+            key = state * width + alphabet[char]
+            next_state = trie.get(key)
+            if next_state is None:
+                next_state = trie[key] = len(terminal)
+                terminal.append(-1)
+            state = next_state
+        terminal[state] = index
+
+    # Шаг 2: Упаковка рёбер в CSR - после сортировки ключей рёбра сгруппированы по вершинам
+    states = len(terminal)
+    edge_start = array("i", [0]) * (states + 1)
+    edge_symbol = array("i")
+    edge_target = array("i")
+    for key in sorted(trie):
+        state, symbol = divmod(key, width)
+        edge_start[state + 1] += 1
+        edge_symbol.append(symbol)
+        edge_target.append(trie[key])
+    del trie
+    for state in range(states):
+        edge_start[state + 1] += edge_start[state]
+
+    # Шаг 3: BFS по бору, суффиксные и словарные ссылки
+    fail = array("i", [0]) * states
+    dict_link = array("i", [-1]) * states
+    automaton = CompiledAhoCorasick(alphabet, patterns, edge_start, edge_symbol, edge_target,
+                                    fail, terminal, dict_link)
+    queue = deque(edge_target[edge_start[0]:edge_start[1]])
+    while queue:
+        state = queue.popleft()
+        fail_state = fail[state]
+        dict_link[state] = fail_state if terminal[fail_state] != -1 else dict_link[fail_state]
+        for edge in range(edge_start[state], edge_start[state + 1]):
+            child = edge_target[edge]
+            # У детей корня fail уже 0; остальным - переход из fail родителя
+            if state:
+                fail[child] = automaton._goto(fail_state, edge_symbol[edge])
+            queue.append(child)
+
+    return automaton
+
+
+if __name__ == "__main__":
+    automaton = compile_aho_corasick(["he", "she", "his", "hers"])
+    print(automaton.search("ushers"))  # [(1, 'she'), (2, 'he'), (2, 'hers')]
@@ -1,4 +1,8 @@
 from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+
+from Lab3.compiled_automata import CompiledAhoCorasick, compile_aho_corasick
 
 
 class AhoCorasickNode:
@@ -53,8 +57,8 @@ def build_aho_corasick(patterns):
     return root
 
 
-def search_aho_corasick(text, root):
-    result = []
+def iter_search_aho_corasick(text, root):
+    """Лениво выдаёт (позиция, шаблон) по мере прохода по тексту"""
     current_node = root
     for i, char in enumerate(text):
         # Переход по failure links, если символ не найден
@@ -64,11 +68,48 @@ def search_aho_corasick(text, root):
             current_node = current_node.children[char]
         # Проверяем, есть ли совпадения
         for pattern in current_node.output:
-            result.append((i - len(pattern) + 1, pattern))
-    return result
+            yield i - len(pattern) + 1, pattern
+
+
+def search_aho_corasick(text, root, limit=None):
+    """Возвращает список совпадений; при limit поиск останавливается после первых limit совпадений"""
+    return list(islice(iter_search_aho_corasick(text, root), limit))
+
+
+_worker_automaton = None
+
+
+def _init_worker(automaton):
+    # Автомат передаётся в каждый процесс один раз, а не с каждым документом
+    global _worker_automaton
+    _worker_automaton = automaton
+
+
+def _search_document(args):
+    document, limit = args
+    return list(islice(_worker_automaton.iter_search(document), limit))
+
+
+def search_documents(documents, patterns, processes=None, limit=None, chunksize=16):
+    """Ищет шаблоны в наборе документов пулом процессов с одним общим автоматом
+
+    patterns - список шаблонов или уже готовый CompiledAhoCorasick
+    (например, загруженный через CompiledAhoCorasick.load), который не перестраивается.
+    Возвращает списки совпадений в порядке документов.
+    """
+    if isinstance(patterns, CompiledAhoCorasick):
+        automaton = patterns
+    else:
+        automaton = compile_aho_corasick(patterns)
+    with Pool(processes, initializer=_init_worker, initargs=(automaton,)) as pool:
+        return pool.map(_search_document, ((document, limit) for document in documents), chunksize)
 
 
-patterns = ["he", "she", "his", "hers"]
-root = build_aho_corasick(patterns)
-text = "ushers"
-print(search_aho_corasick(text, root))  # [(1, 'she'), (2, 'he'), (2, 'hers')]
+if __name__ == "__main__":
+    patterns = ["he", "she", "his", "hers"]
+    root = build_aho_corasick(patterns)
+    text = "ushers"
+    print(search_aho_corasick(text, root))  # [(1, 'she'), (2, 'he'), (2, 'hers')]
+    print(search_aho_corasick(text, root, limit=1))  # [(1, 'she')]
+    print(search_documents(["ushers", "this", "hershe"], patterns))
+    print(search_documents(["ushers", "this", "hershe"], compile_aho_corasick(patterns)))
@@ -1,4 +1,9 @@
-def prefix_func(pattern: str) -> list:
+import mmap
+from array import array
+from collections.abc import Sequence
+
+
+def prefix_func(pattern: Sequence) -> list:
     lps = [0] * len(pattern)
     prefix_len = 0
     i = 1
@@ -13,8 +18,9 @@ def prefix_func(pattern: str) -> list:
     return lps
 
 
-def kmp(my_str: str, pattern:str) -> tuple[int, int]:
-    lps = prefix_func(pattern)
+def kmp(my_str: Sequence, pattern: Sequence, lps: list = None) -> tuple[int, int]:
+    if lps is None:
+        lps = prefix_func(pattern)
     count = 0
     proverok = 0
     compare_index = 0
@@ -33,4 +39,77 @@ def kmp(my_str: str, pattern:str) -> tuple[int, int]:
     return count, proverok
 
 
+def kmp_iter(my_str: Sequence, pattern: Sequence, lps: list = None):
+    """Лениво выдаёт позиции вхождений; можно остановиться, не дочитав текст"""
+    if not pattern:
+        return
+    if lps is None:
+        lps = prefix_func(pattern)
+    compare_index = 0
+    for i in range(len(my_str)):
+        while (compare_index > 0) and (my_str[i] != pattern[compare_index]):
+            compare_index = lps[compare_index - 1]
+
+        if my_str[i] == pattern[compare_index]:
+            compare_index += 1
+
+        if compare_index == len(pattern):
+            yield i - len(pattern) + 1
+            compare_index = lps[len(pattern) - 1]
+
+
+def _as_flat_buffer(sequence):
+    """memoryview непрерывного буфера или None, если у последовательности его нет"""
+    try:
+        view = memoryview(sequence)
+    except TypeError:
+        return None
+    return view if view.c_contiguous and view.ndim == 1 else None
+
+
+def _pattern_like(pattern, view: memoryview):
+    """Шаблон в том же формате элементов, что и буфер текста, или None"""
+    pattern_view = _as_flat_buffer(pattern)
+    if pattern_view is not None and pattern_view.format == view.format:
+        return pattern_view
+    try:
+        return memoryview(array(view.format, pattern))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def find_subsequence(sequence: Sequence, pattern: Sequence):
+    """Лениво выдаёт позиции (в элементах) вхождений pattern в любую последовательность
+
+    Для bytes, bytearray, mmap, array.array, memoryview и массивов NumPy поиск идёт по сырым
+    байтам буфера через bytes.find, без создания объекта на каждый элемент; найденное
+    смещение принимается, только если оно выровнено по размеру элемента.
+    Остальные последовательности (например, list[int]) ищутся через kmp_iter.
+    """
+    view = _as_flat_buffer(sequence)
+    pattern_view = _pattern_like(pattern, view) if view is not None else None
+    if pattern_view is None:
+        yield from kmp_iter(sequence, pattern)
+        return
+    if not len(pattern_view):
+        return
+
+    itemsize = view.itemsize
+    needle = pattern_view.tobytes()
+    # bytes, bytearray и mmap умеют find сами, остальное копируем в bytes один раз
+    if isinstance(sequence, (bytes, bytearray, mmap.mmap)):
+        haystack = sequence
+    else:
+        haystack = view.cast("B").tobytes()
+    position = haystack.find(needle)
+    while position != -1:
+        if position % itemsize == 0:
+            yield position // itemsize
+            position = haystack.find(needle, position + itemsize)
+        else:
+            # Совпадение посреди элемента: продолжаем со следующей границы элемента
+            position = haystack.find(needle, position + itemsize - position % itemsize)
+
 
+def count_subsequence(sequence: Sequence, pattern: Sequence) -> int:
+    return sum(1 for _ in find_subsequence(sequence, pattern))
@@ -0,0 +1,97 @@
+import mmap
+
+from Lab4.KMP_search import prefix_func
+
+
+class KMPStreamMatcher:
+    """Потоковый поиск KMP: текст подаётся кусками (str или bytes)
+
+    Между кусками сохраняется только compare_index, поэтому память
+    ограничена длиной паттерна, а не размером текста.
+    """
+
+    def __init__(self, pattern):
+        if not pattern:
+            raise ValueError("KMPStreamMatcher: pattern must not be empty.")
+        self.pattern = pattern
+        self.lps = prefix_func(pattern)
+        self.compare_index = 0  # Сколько символов паттерна уже совпало
+        self.offset = 0  # Абсолютная позиция начала следующего куска
+        self.count = 0
+        self.proverok = 0
+
+    def feed(self, chunk) -> list[int]:
+        """Обрабатывает очередной кусок, возвращает абсолютные позиции найденных вхождений"""
+        if isinstance(chunk, str) != isinstance(self.pattern, str):
+            raise TypeError("KMPStreamMatcher: chunk and pattern must be both str or both bytes.")
+
+        pattern = self.pattern
+        lps = self.lps
+        m = len(pattern)
+        compare_index = self.compare_index
+        proverok = 0
+        found = []
+        for i, char in enumerate(chunk):
+            proverok += 1
+            while compare_index > 0 and char != pattern[compare_index]:
+                compare_index = lps[compare_index - 1]
+                proverok += 1
+
+            if char == pattern[compare_index]:
+                compare_index += 1
+
+            if compare_index == m:
+                found.append(self.offset + i - m + 1)
+                compare_index = lps[m - 1]
+
+        self.compare_index = compare_index
+        self.offset += len(chunk)
+        self.count += len(found)
+        self.proverok += proverok
+        return found
+
+    def reset(self):
+        """Сбрасывает состояние для поиска в новом потоке"""
+        self.compare_index = 0
+        self.offset = 0
+        self.count = 0
+        self.proverok = 0
+
+
+def kmp_stream(chunks, pattern) -> tuple[int, list[int]]:
+    """Ищет pattern в последовательности кусков, возвращает число и позиции вхождений"""
+    matcher = KMPStreamMatcher(pattern)
+    positions = []
+    for chunk in chunks:
+        positions.extend(matcher.feed(chunk))
+    return matcher.count, positions
+
+
+def kmp_file(path: str, pattern: bytes, chunk_size: int = 1 << 20,
+             with_positions: bool = True) -> tuple[int, list[int]]:
+    """Ищет байтовый pattern в файле через mmap, позиции - смещения в байтах
+
+    При with_positions=False позиции не накапливаются и память не растёт с числом вхождений.
+    """
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+    matcher = KMPStreamMatcher(pattern)
+    positions = []
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Пустой файл нельзя отобразить в память
+            return 0, []
+        with mm:
+            for start in range(0, len(mm), chunk_size):
+                found = matcher.feed(mm[start:start + chunk_size])
+                if with_positions:
+                    positions.extend(found)
+    return matcher.count, positions
+
+
+if __name__ == "__main__":
+    matcher = KMPStreamMatcher("abab")
+    print(matcher.feed("aba"), matcher.feed("bab"), matcher.feed("ab"))  # [] [0, 2] [4]
+    print(kmp_stream([b"xxab", b"abxab", b"ab"], b"abab"))  # (2, [2, 7])
@@ -0,0 +1,85 @@
+def get_shift_or_masks(pattern) -> dict:
+    """Маски Shift-Or: в маске символа сброшен бит j, если pattern[j] совпадает с символом"""
+    full = (1 << len(pattern)) - 1
+    masks = {}
+    for j, char in enumerate(pattern):
+        masks[char] = masks.get(char, full) & ~(1 << j)
+    return masks
+
+
+def bitap(my_str, pattern) -> tuple[int, int]:
+    """Точный поиск Shift-Or: одна операция над битовой маской на символ текста
+
+    Для шаблонов до 63 символов маска помещается в машинное слово, для длинных
+    Python сам переходит на длинную арифметику.
+    """
+    m = len(pattern)
+    if m == 0:
+        return 0, 0
+    masks = get_shift_or_masks(pattern)
+    full = (1 << m) - 1
+    found_bit = 1 << (m - 1)
+
+    count = 0
+    proverok = 0
+    state = full  # Бит j равен 0, если pattern[0:j+1] совпадает с концом прочитанного текста
+    for char in my_str:
+        proverok += 1
+        state = ((state << 1) | masks.get(char, full)) & full
+        if not state & found_bit:
+            count += 1
+    return count, proverok
+
+
+def get_shift_and_masks(pattern) -> dict:
+    """Маски Shift-And: в маске символа установлен бит j, если pattern[j] совпадает с символом"""
+    masks = {}
+    for j, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << j)
+    return masks
+
+
+def bitap_approx(my_str, pattern, k: int = 1, indels: bool = True) -> tuple[int, int]:
+    """Приближённый поиск Ву-Манбера: позиции конца вхождений с не более чем k ошибками
+
+    При indels=True ошибки - замены, вставки и удаления (расстояние Левенштейна),
+    при indels=False - только замены (расстояние Хэмминга).
+    Возвращает (количество позиций конца, число операций над масками).
+    """
+    m = len(pattern)
+    if m == 0:
+        return 0, 0
+    masks = get_shift_and_masks(pattern)
+    full = (1 << m) - 1
+    found_bit = 1 << (m - 1)
+
+    # states[d]: бит j установлен, если pattern[0:j+1] совпадает с концом текста с <= d ошибками
+    # Изначально первые d символов шаблона можно "удалить"
+    states = [(1 << d) - 1 if indels else 0 for d in range(k + 1)]
+    count = 0
+    proverok = 0
+    for char in my_str:
+        mask = masks.get(char, 0)
+        previous = states[0]
+        states[0] = ((previous << 1) | 1) & mask
+        proverok += 1
+        for d in range(1, k + 1):
+            current = states[d]
+            # Совпадение | замена
+            new_state = (((current << 1) | 1) & mask) | ((previous << 1) | 1)
+            if indels:
+                # Лишний символ в тексте | пропущенный символ шаблона
+                new_state |= previous | (states[d - 1] << 1) | 1
+            states[d] = new_state & full
+            previous = current
+            proverok += 1
+        if states[k] & found_bit:
+            count += 1
+    return count, proverok
+
+
+if __name__ == "__main__":
+    text = "на краю дороги стоял дуп, а за ним дубы и дкб"
+    print(bitap(text, "дуб"))
+    print(bitap_approx(text, "дуб", k=1, indels=False))
+    print(bitap_approx(text, "дуб", k=1))
@@ -0,0 +1,116 @@
+def as_bytes_view(buffer) -> memoryview:
+    """Байтовое представление любого объекта с buffer protocol без копирования"""
+    return memoryview(buffer).cast("B")
+
+
+def get_bad_char_table_bytes(pattern: memoryview) -> list:
+    """Таблица последних вхождений для всех 256 значений байта"""
+    result = [-1] * 256
+    for i in range(len(pattern)):
+        result[pattern[i]] = i
+    return result
+
+
+def bm_bytes(text, pattern):
+    """Бойер-Мур с эвристикой плохого символа по байтам: bytes, bytearray, mmap, memoryview"""
+    text = as_bytes_view(text)
+    pattern = as_bytes_view(pattern)
+    n, m = len(text), len(pattern)
+    if m == 0 or n < m:
+        return 0, 0
+
+    symbol_indexes = get_bad_char_table_bytes(pattern)
+    result = 0
+    shift = 0
+    comparisons = 0
+
+    while shift <= n - m:
+        current_index = m - 1
+
+        # Сравниваем байты паттерна с текстом справа налево
+        while current_index >= 0:
+            comparisons += 1
+            if pattern[current_index] != text[shift + current_index]:
+                break
+            current_index -= 1
+
+        if current_index == -1:
+            result += 1
+            # Смещаем так, чтобы байт после окна совпал с последним его вхождением в паттерн
+            if shift + m < n:
+                shift += m - symbol_indexes[text[shift + m]]
+            else:
+                shift += 1
+        else:
+            shift += max(1, current_index - symbol_indexes[text[shift + current_index]])
+
+    return result, comparisons
+
+
+def horspool_bytes(text, pattern):
+    """Бойер-Мур-Хорспул: сдвиг по байту текста под последним символом паттерна"""
+    text = as_bytes_view(text)
+    pattern = as_bytes_view(pattern)
+    n, m = len(text), len(pattern)
+    if m == 0 or n < m:
+        return 0, 0
+
+    # Последний символ паттерна в таблицу не входит, иначе сдвиг был бы нулевым
+    shift_table = [m] * 256
+    for i in range(m - 1):
+        shift_table[pattern[i]] = m - 1 - i
+
+    result = 0
+    shift = 0
+    comparisons = 0
+    while shift <= n - m:
+        current_index = m - 1
+        while current_index >= 0:
+            comparisons += 1
+            if pattern[current_index] != text[shift + current_index]:
+                break
+            current_index -= 1
+
+        if current_index == -1:
+            result += 1
+        shift += shift_table[text[shift + m - 1]]
+
+    return result, comparisons
+
+
+def sunday_bytes(text, pattern):
+    """Алгоритм Санди: сдвиг по байту сразу за окном, сравнение слева направо"""
+    text = as_bytes_view(text)
+    pattern = as_bytes_view(pattern)
+    n, m = len(text), len(pattern)
+    if m == 0 or n < m:
+        return 0, 0
+
+    shift_table = [m + 1] * 256
+    for i in range(m):
+        shift_table[pattern[i]] = m - i
+
+    result = 0
+    shift = 0
+    comparisons = 0
+    while shift <= n - m:
+        current_index = 0
+        while current_index < m:
+            comparisons += 1
+            if pattern[current_index] != text[shift + current_index]:
+                break
+            current_index += 1
+
+        if current_index == m:
+            result += 1
+        if shift + m >= n:
+            break
+        shift += shift_table[text[shift + m]]
+
+    return result, comparisons
+
+
+if __name__ == "__main__":
+    data = "Дуб зелёный, златая цепь на дубе том".encode("utf-8")
+    for func in (bm_bytes, horspool_bytes, sunday_bytes):
+        print(func.__name__, func(data, "дуб".encode("utf-8")))
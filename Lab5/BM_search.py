@@ -1,21 +1,27 @@
-def get_bad_char_dict(pattern: str, array_size: int) -> list:
-    """Создает таблицу смещений для эвристики плохого символа"""
-    result = [-1] * array_size
+def get_bad_char_map(pattern: str) -> dict:
+    """Создает таблицу смещений для эвристики плохого символа
+
+    Таблица строится только по алфавиту паттерна: символ -> индекс последнего вхождения.
+    Все символы, которых нет в паттерне, попадают в один класс с индексом -1,
+    поэтому разные буквы (например, кириллица) не склеиваются между собой.
+    """
+    result = {}
 
     for i in range(len(pattern)):
-        result[ord(pattern[i]) % array_size] = i
+        result[pattern[i]] = i
 
     return result
 
 
-def bm(text: str, pattern: str, array_size: int = 256):
+def bm(text: str, pattern: str, symbol_indexes: dict = None):
     """Реализация алгоритма Бойера-Мура с эвристикой плохого символа"""
-    symbol_indexes = get_bad_char_dict(pattern, array_size)
+    if symbol_indexes is None:
+        symbol_indexes = get_bad_char_map(pattern)
     result = 0
     shift = 0
     comparisons = 0
 
-    while shift < (len(text) - len(pattern)):
+    while shift <= (len(text) - len(pattern)):
         current_index = len(pattern) - 1
 
         # Сравниваем символы паттерна с текстом справа налево
@@ -29,8 +35,7 @@ def bm(text: str, pattern: str, array_size: int = 256):
 
             # Вычисляем смещение для следующего поиска
             if shift + len(pattern) < len(text):
-                char_code = ord(text[shift + len(pattern)]) % array_size
-                indent = len(pattern) - symbol_indexes[char_code]
+                indent = len(pattern) - symbol_indexes.get(text[shift + len(pattern)], -1)
             else:
                 indent = 1
 
@@ -38,11 +43,32 @@ def bm(text: str, pattern: str, array_size: int = 256):
         else:
 
             # Вычисляем смещение на основе эвристики плохого символа
-            char_code = ord(text[shift + len(pattern)]) % array_size
-            indent = symbol_indexes[char_code]
+            indent = symbol_indexes.get(text[shift + current_index], -1)
 
             shift += max(1, current_index - indent)
 
     return result, comparisons
 
+
+def bm_iter(text: str, pattern: str, symbol_indexes: dict = None):
+    """Лениво выдаёт позиции вхождений (эвристика плохого символа)"""
+    if not pattern:
+        return
+    if symbol_indexes is None:
+        symbol_indexes = get_bad_char_map(pattern)
+    m = len(pattern)
+    n = len(text)
+    shift = 0
+
+    while shift <= n - m:
+        current_index = m - 1
+        while current_index >= 0 and pattern[current_index] == text[shift + current_index]:
+            current_index -= 1
+
+        if current_index == -1:
+            yield shift
+            shift += m - symbol_indexes.get(text[shift + m], -1) if shift + m < n else 1
+        else:
+            shift += max(1, current_index - symbol_indexes.get(text[shift + current_index], -1))
+
 # https://habr.com/ru/articles/660767/
@@ -1,4 +1,4 @@
-from Lab5.BM_search import get_bad_char_dict
+from Lab5.BM_search import get_bad_char_map
 
 
 def compute_suffix_table(pattern):
@@ -51,44 +51,58 @@ def compute_good_suffix_shift(pattern):
     return shift
 
 
-def bm_suffix(text: str, pattern: str, array_size: int = 256):
-    """Реализация алгоритма Бойера-Мура с эвристикой плохого символа и хорошего суффикса"""
+def bm_suffix(text: str, pattern: str, linear: bool = False,
+              bad_char: dict = None, good_suffix: list = None):
+    """Реализация алгоритма Бойера-Мура с эвристикой плохого символа и хорошего суффикса
+
+    При linear=True используется правило Галиля: после полного совпадения и сдвига на период
+    уже проверенный префикс окна повторно не сравнивается, поэтому на периодичных
+    строках число сравнений остаётся линейным (не больше ~2n), а не O(n*m).
+    bad_char и good_suffix можно передать заранее посчитанными.
+    """
     if not pattern or not text:
         return 0, 0
 
     # Вычисляем таблицу смещений для эвристики плохого символа
-    bad_char = get_bad_char_dict(pattern, array_size)
+    if bad_char is None:
+        bad_char = get_bad_char_map(pattern)
 
     # Вычисляем таблицу смещений для эвристики хорошего суффикса
-    good_suffix = compute_good_suffix_shift(pattern)
+    if good_suffix is None:
+        good_suffix = compute_good_suffix_shift(pattern)
 
     result = 0
     shift = 0
     comparisons = 0
     m = len(pattern)
     n = len(text)
+    # Сколько первых символов окна заведомо совпадают с паттерном (правило Галиля)
+    known = 0
 
     while shift <= (n - m):
         current_index = m - 1
 
         # Сравниваем символы паттерна с текстом справа налево
-        while current_index >= 0 and pattern[current_index] == text[shift + current_index]:
+        while current_index >= known and pattern[current_index] == text[shift + current_index]:
             comparisons += 1
             current_index -= 1
 
-        # Если current_index стал -1, значит нашли совпадение
-        if current_index == -1:
+        # Если дошли до известного префикса, значит нашли совпадение
+        if current_index < known:
             result += 1
             comparisons += 1
 
             # Смещаемся на основе эвристики хорошего суффикса для символа после паттерна
+            # good_suffix[0] - период паттерна, первые m - период символов нового окна уже совпали
             shift += good_suffix[0]
+            if linear:
+                known = m - good_suffix[0]
         else:
             comparisons += 1
+            known = 0
 
             # Вычисляем смещение по эвристике плохого символа
-            char_code = ord(text[shift + current_index]) % array_size
-            bad_char_shift = max(1, current_index - bad_char[char_code])
+            bad_char_shift = max(1, current_index - bad_char.get(text[shift + current_index], -1))
 
             # Вычисляем смещение по эвристике хорошего суффикса
             good_suffix_shift = good_suffix[current_index]
@@ -97,3 +111,34 @@ def bm_suffix(text: str, pattern: str, array_size: int = 256):
             shift += max(bad_char_shift, good_suffix_shift)
 
     return result, comparisons
+
+
+def bm_suffix_iter(text: str, pattern: str, linear: bool = False,
+                   bad_char: dict = None, good_suffix: list = None):
+    """Лениво выдаёт позиции вхождений (плохой символ, хороший суффикс и правило Галиля)"""
+    if not pattern:
+        return
+    if bad_char is None:
+        bad_char = get_bad_char_map(pattern)
+    if good_suffix is None:
+        good_suffix = compute_good_suffix_shift(pattern)
+
+    m = len(pattern)
+    n = len(text)
+    shift = 0
+    known = 0
+
+    while shift <= (n - m):
+        current_index = m - 1
+        while current_index >= known and pattern[current_index] == text[shift + current_index]:
+            current_index -= 1
+
+        if current_index < known:
+            yield shift
+            shift += good_suffix[0]
+            if linear:
+                known = m - good_suffix[0]
+        else:
+            known = 0
+            bad_char_shift = max(1, current_index - bad_char.get(text[shift + current_index], -1))
+            shift += max(bad_char_shift, good_suffix[current_index])
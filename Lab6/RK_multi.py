@@ -0,0 +1,63 @@
+from collections import defaultdict
+
+# Два больших простых модуля: вероятность совпадения обоих хешей у разных строк ~ 1e-18
+MOD1 = 1_000_000_007
+MOD2 = 998_244_353
+
+
+def double_hash(s, base: int = 256) -> int:
+    """Двойной полиномиальный хеш строки, упакованный в одно 64-битное число"""
+    h1 = h2 = 0
+    for char in s:
+        code = ord(char)
+        h1 = (h1 * base + code) % MOD1
+        h2 = (h2 * base + code) % MOD2
+    return (h1 << 32) | h2
+
+
+def get_substrings_rk_multi(text: str, patterns, base: int = 256) -> dict[str, tuple[int, list[int]]]:
+    """Рабин-Карп для множества паттернов за один проход хеша по тексту на каждую длину
+
+    Паттерны группируются по длине, для каждой группы хеш окна сверяется с множеством хешей.
+    Возвращает {паттерн: (количество, позиции)}.
+    """
+    positions = {pattern: [] for pattern in patterns if pattern}
+    n = len(text)
+
+    # Группируем паттерны по длине: {длина: {хеш: [паттерны]}}
+    buckets = defaultdict(lambda: defaultdict(list))
+    for pattern in positions:
+        if len(pattern) <= n:
+            buckets[len(pattern)][double_hash(pattern, base)].append(pattern)
+
+    codes = [ord(char) for char in text]
+
+    for m, table in buckets.items():
+        # Коэффициенты для старшего символа окна: base^(m-1) по каждому модулю
+        first1 = pow(base, m - 1, MOD1)
+        first2 = pow(base, m - 1, MOD2)
+
+        h1 = h2 = 0
+        for i in range(m):
+            h1 = (h1 * base + codes[i]) % MOD1
+            h2 = (h2 * base + codes[i]) % MOD2
+
+        for i in range(n - m + 1):
+            candidates = table.get((h1 << 32) | h2)
+            if candidates is not None:
+                # Проверка на коллизию: при двойном хеше срабатывает крайне редко
+                window = text[i:i + m]
+                for pattern in candidates:
+                    if window == pattern:
+                        positions[pattern].append(i)
+
+            if i < n - m:
+                h1 = ((h1 - codes[i] * first1) * base + codes[i + m]) % MOD1
+                h2 = ((h2 - codes[i] * first2) * base + codes[i + m]) % MOD2
+
+    return {pattern: (len(found), found) for pattern, found in positions.items()}
+
+
+if __name__ == "__main__":
+    print(get_substrings_rk_multi("ushers", ["he", "she", "his", "hers"]))
+    # {'he': (1, [2]), 'she': (1, [1]), 'his': (0, []), 'hers': (1, [2])}
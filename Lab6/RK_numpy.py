@@ -0,0 +1,77 @@
+import sys
+
+import numpy as np
+
+MOD = 2_147_483_647  # 2^31 - 1: произведения двух остатков помещаются в int64
+BASE = 1_000_003
+CHUNK_SIZE = 1 << 22  # Окон на один кусок: ограничивает память на большом тексте
+
+UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+_POWERS: dict[tuple[int, int], np.ndarray] = {}
+
+
+def _powers(length: int, base: int = BASE, mod: int = MOD) -> np.ndarray:
+    """base^0 .. base^(length-1) по модулю; таблица кэшируется между вызовами и дорастает удвоением"""
+    powers = _POWERS.get((base, mod), np.ones(1, dtype=np.int64))
+    while len(powers) < length:
+        step = pow(base, len(powers), mod)
+        powers = np.concatenate((powers, powers[:length - len(powers)] * step % mod))
+        powers.flags.writeable = False
+        _POWERS[(base, mod)] = powers
+    return powers[:length]
+
+
+def _codes(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode(UTF32), dtype=np.uint32).astype(np.int64)
+
+
+def rk_numpy_positions(text: str, pattern: str, chunk_size: int = CHUNK_SIZE) -> np.ndarray:
+    """Рабин-Карп на NumPy: хеши всех окон куска считаются сразу через префиксные суммы
+
+    Хеш окна с началом i: S_i = sum(t[i + j] * base^(i + j)) = base^i * H(окна),
+    поэтому окно совпадает с шаблоном по хешу, если S_i == H(шаблона) * base^i (mod).
+    Степени отсчитываются от начала куска, так что значения не переполняют int64.
+    """
+    n, m = len(text), len(pattern)
+    if m == 0 or n < m:
+        return np.empty(0, dtype=np.int64)
+
+    starts = n - m + 1
+    powers = _powers(min(chunk_size, starts) + m - 1)
+    pattern_codes = _codes(pattern)
+    pattern_hash = int((pattern_codes * powers[:m] % MOD).sum() % MOD)
+
+    found = []
+    for start in range(0, starts, chunk_size):
+        windows = min(chunk_size, starts - start)
+        codes = _codes(text[start:start + windows + m - 1])
+
+        weighted = codes * powers[:len(codes)] % MOD
+        prefix = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(weighted, out=prefix[1:])
+        prefix %= MOD
+
+        window_hashes = (prefix[m:] - prefix[:-m]) % MOD
+        candidates = np.flatnonzero(window_hashes == pattern_hash * powers[:windows] % MOD)
+
+        # Проверяем кандидатов посимвольно, сразу для всех
+        for j in range(m):
+            if not len(candidates):
+                break
+            candidates = candidates[codes[candidates + j] == pattern_codes[j]]
+        found.append(candidates + start)
+
+    return np.concatenate(found)
+
+
+def get_substring_rk_numpy(text: str, pattern: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """Количество вхождений, как у get_substring_rk"""
+    return len(rk_numpy_positions(text, pattern, chunk_size))
+
+
+if __name__ == "__main__":
+    with open("tests/search/test.txt", "r", encoding="utf-8") as f:
+        corpus = f.read()
+    print(get_substring_rk_numpy(corpus, "дуб"), rk_numpy_positions(corpus, "дуб", chunk_size=1000)[:5])
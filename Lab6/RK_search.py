@@ -1,27 +1,38 @@
-def get_substring_rk(text: str, pattern: str, base: int = 256, mod: int = 9973) -> int:
+def get_pattern_hash_rk(pattern: str, base: int = 256, mod: int = 9973) -> tuple[int, int]:
+    """Возвращает хеш шаблона и коэффициент base^(m-1) mod mod для старшего символа окна"""
+    pattern_hash = 0
+    first_index_hash = 1  # Коэффициент для старшего символа окна
+
+    # Вычисляем first_index_hash = base^(m-1) mod mod
+    for _ in range(len(pattern) - 1):
+        first_index_hash = (first_index_hash * base) % mod
+
+    for char in pattern:
+        pattern_hash = (pattern_hash * base + ord(char)) % mod
+
+    return pattern_hash, first_index_hash
+
+
+def get_substring_rk(text: str, pattern: str, base: int = 256, mod: int = 9973,
+                     pattern_hashes: tuple[int, int] = None) -> int:
     n, m = len(text), len(pattern)
     if m == 0 or n < m:
         return 0
 
     result = 0
-    pattern_hash = 0
     text_hash = 0
-    first_index_hash = 1  # Коэффициент для старшего символа окна
-
-    # Вычисляем first_index_hash = base^(m-1) mod mod
-    for _ in range(m - 1):
-        first_index_hash = (first_index_hash * base) % mod
+    if pattern_hashes is None:
+        pattern_hashes = get_pattern_hash_rk(pattern, base, mod)
+    pattern_hash, first_index_hash = pattern_hashes
 
-    # Вычисляем начальные хеши для шаблона и первого окна текста
+    # Вычисляем начальный хеш первого окна текста
     for i in range(m):
-        pattern_hash = (pattern_hash * base + ord(pattern[i])) % mod
         text_hash = (text_hash * base + ord(text[i])) % mod
 
     # Перебор окон текста
     for i in range(n - m + 1):
         # Если хеши совпадают, делаем посимвольное сравнение для проверки коллизии
         if pattern_hash == text_hash and text[i:i + m] == pattern:
-            # result.append(i)
             result += 1
 
         # Если окно не последнее, обновляем хеш для следующего окна
@@ -34,3 +45,26 @@ def get_substring_rk(text: str, pattern: str, base: int = 256, mod: int = 9973)
             text_hash %= mod
 
     return result
+
+
+def get_substring_rk_iter(text: str, pattern: str, base: int = 256, mod: int = 9973,
+                          pattern_hashes: tuple[int, int] = None):
+    """Лениво выдаёт позиции вхождений; можно остановиться, не дочитав текст"""
+    n, m = len(text), len(pattern)
+    if m == 0 or n < m:
+        return
+
+    if pattern_hashes is None:
+        pattern_hashes = get_pattern_hash_rk(pattern, base, mod)
+    pattern_hash, first_index_hash = pattern_hashes
+
+    text_hash = 0
+    for i in range(m):
+        text_hash = (text_hash * base + ord(text[i])) % mod
+
+    for i in range(n - m + 1):
+        if pattern_hash == text_hash and text[i:i + m] == pattern:
+            yield i
+
+        if i < n - m:
+            text_hash = ((text_hash - ord(text[i]) * first_index_hash) * base + ord(text[i + m])) % mod
@@ -0,0 +1,62 @@
+from functools import lru_cache
+
+from Lab4.KMP_search import kmp, prefix_func
+from Lab5.BM_search import bm, get_bad_char_map
+from Lab5.BM_search_with_suffix import bm_suffix, compute_good_suffix_shift
+from Lab6.RK_search import get_pattern_hash_rk, get_substring_rk
+
+# Алгоритм -> (построение таблиц по шаблону, функция поиска, принимающая эти таблицы)
+ENGINES = {
+    "kmp": (lambda pattern: {"lps": prefix_func(pattern)}, kmp),
+    "bm": (lambda pattern: {"symbol_indexes": get_bad_char_map(pattern)}, bm),
+    "bm_suffix": (lambda pattern: {"bad_char": get_bad_char_map(pattern),
+                                   "good_suffix": compute_good_suffix_shift(pattern)}, bm_suffix),
+    "rk": (lambda pattern: {"pattern_hashes": get_pattern_hash_rk(pattern)}, get_substring_rk),
+}
+
+CACHE_SIZE = 256
+
+
+class CompiledPattern:
+    """Шаблон с заранее посчитанными таблицами выбранного алгоритма"""
+
+    def __init__(self, pattern: str, algorithm: str = "kmp"):
+        if algorithm not in ENGINES:
+            raise ValueError(f"CompiledPattern: unknown algorithm {algorithm!r}, expected one of {list(ENGINES)}.")
+        build_tables, self._search = ENGINES[algorithm]
+        self.pattern = pattern
+        self.algorithm = algorithm
+        self.tables = build_tables(pattern)
+
+    def search(self, text: str):
+        """Ищет шаблон в тексте; результат тот же, что у исходной функции алгоритма"""
+        return self._search(text, self.pattern, **self.tables)
+
+    def __repr__(self):
+        return f"CompiledPattern({self.pattern!r}, algorithm={self.algorithm!r})"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile(pattern: str, algorithm: str) -> CompiledPattern:
+    return CompiledPattern(pattern, algorithm)
+
+
+def compile(pattern: str, algorithm: str = "kmp") -> CompiledPattern:
+    """Возвращает скомпилированный шаблон из LRU-кеша (ключ - шаблон и алгоритм)
+
+    Аргументы приводятся к позиционным, поэтому compile("x"), compile("x", "kmp")
+    и compile("x", algorithm="kmp") попадают в одну запись кеша.
+    Счётчики попаданий и промахов: compile.cache_info(), очистка: compile.cache_clear().
+    """
+    return _compile(pattern, algorithm)
+
+
+compile.cache_info = _compile.cache_info
+compile.cache_clear = _compile.cache_clear
+
+
+if __name__ == "__main__":
+    records = ["на краю дороги стоял дуб", "дуб дубу рознь", "берёза"]
+    for algorithm in ENGINES:
+        print(algorithm, [compile("дуб", algorithm).search(record) for record in records])
+    print(compile.cache_info())
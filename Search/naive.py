@@ -11,3 +11,10 @@ def naive_find(my_str: str, pattern:str) -> tuple[int, int]:
         if flag:
             count += 1
     return count, proverok
+
+
+def naive_iter(my_str: str, pattern: str):
+    """Лениво выдаёт позиции вхождений"""
+    for i in range(len(my_str) - len(pattern) + 1):
+        if my_str[i:i + len(pattern)] == pattern:
+            yield i
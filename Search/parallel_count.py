@@ -0,0 +1,94 @@
+import mmap
+import os
+from multiprocessing import Pool
+
+from Search.positions import ENGINES, iter_positions
+
+
+def shard_bounds(n: int, m: int, shards: int) -> list[tuple[int, int]]:
+    """Делит позиции начала вхождений [0, n - m] на shards непересекающихся диапазонов
+
+    Шард [start, end) читает текст text[start:end + m - 1], то есть перекрывается со
+    следующим на m - 1 символ. Каждое вхождение начинается ровно в одном шарде и целиком
+    в него попадает, поэтому при слиянии ничего не считается дважды.
+    """
+    starts = n - m + 1
+    if starts <= 0:
+        return []
+    shards = max(1, min(shards, starts))
+    step = -(-starts // shards)
+    return [(start, min(start + step, starts)) for start in range(0, starts, step)]
+
+
+def _search_shard(text: str, offset: int, pattern: str, engine: str, with_positions: bool):
+    if with_positions:
+        positions = [offset + position for position in iter_positions(text, pattern, engine)]
+        return len(positions), positions
+    return ENGINES[engine](text, pattern), []
+
+
+def _search_text_shard(args):
+    text, offset, pattern, engine, with_positions = args
+    return _search_shard(text, offset, pattern, engine, with_positions)
+
+
+def _search_file_shard(args):
+    path, start, end, pattern, engine, with_positions = args
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # latin-1 переводит байты в символы один к одному, смещения остаются байтовыми
+        text = mm[start:end + len(pattern) - 1].decode("latin-1")
+    return _search_shard(text, start, pattern, engine, with_positions)
+
+
+def _merge(results) -> tuple[int, list[int]]:
+    total = 0
+    positions = []
+    for count, shard_positions in results:
+        total += count
+        positions.extend(shard_positions)
+    return total, positions
+
+
+def parallel_count(text: str, pattern: str, engine: str = "kmp", processes: int = None,
+                   shards: int = None, with_positions: bool = False) -> tuple[int, list[int]]:
+    """Считает вхождения pattern в text по шардам в пуле процессов
+
+    Возвращает (количество, позиции); позиции собираются только при with_positions=True.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"parallel_count: unknown engine {engine!r}, expected one of {list(ENGINES)}.")
+    if not pattern:
+        return 0, []
+    processes = processes or os.cpu_count()
+    bounds = shard_bounds(len(text), len(pattern), shards or processes * 4)
+    tasks = ((text[start:end + len(pattern) - 1], start, pattern, engine, with_positions)
+             for start, end in bounds)
+    with Pool(processes) as pool:
+        return _merge(pool.imap(_search_text_shard, tasks))
+
+
+def parallel_count_file(path: str, pattern: str, engine: str = "kmp", processes: int = None,
+                        shard_size: int = 1 << 24, with_positions: bool = False) -> tuple[int, list[int]]:
+    """То же для файла: процессы сами читают свои шарды через mmap, передаются только смещения
+
+    Поиск идёт по байтам UTF-8, позиции - смещения в байтах.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"parallel_count_file: unknown engine {engine!r}, expected one of {list(ENGINES)}.")
+    pattern = pattern.encode("utf-8").decode("latin-1")
+    if not pattern:
+        return 0, []
+    with open(path, "rb") as f:
+        size = f.seek(0, 2)
+    shards = -(-size // shard_size)
+    tasks = [(path, start, end, pattern, engine, with_positions)
+             for start, end in shard_bounds(size, len(pattern), shards)]
+    with Pool(processes) as pool:
+        return _merge(pool.imap(_search_file_shard, tasks))
+
+
+if __name__ == "__main__":
+    corpus = open("tests/search/test.txt", "r", encoding="utf-8").read() * 20
+    for name in ENGINES:
+        print(name, parallel_count(corpus, "дуб", name)[0], ENGINES[name](corpus, "дуб"))
+    print(parallel_count_file("tests/search/test.txt", "дуб", "bm", shard_size=4096, with_positions=True)[1][:5])
@@ -0,0 +1,420 @@
+import json
+import os
+import random
+import time
+from collections import Counter
+
+from Lab4.KMP_search import kmp, prefix_func
+from Lab5.BM_search import get_bad_char_map
+from Lab5.BM_search_with_suffix import compute_good_suffix_shift
+from Lab6.RK_search import get_substring_rk
+from Search.compiled_search import ENGINES as TABLE_BUILDERS
+from Search.naive import naive_find
+from Search.positions import ENGINES
+
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(__file__), "planner_model.json")
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "search", "test.txt")
+# Сколько символов текста (из нескольких мест) смотрим, чтобы оценить частоты символов
+ALPHABET_SAMPLE = 4096
+SAMPLE_PIECES = 8
+# Дальше этой вероятности дойти до позиции шаблона окна не просматриваются
+NEGLIGIBLE = 1e-9
+# Допустимое отношение времени выбранного движка к лучшему в проверке evaluate
+CHECK_TOLERANCE = 1.2
+
+# Признаки модели стоимости: время = сумма коэффициент * признак (в наносекундах)
+TERMS = ("per_window", "per_shift", "per_comparison", "per_pattern_char", "intercept")
+
+# Коэффициенты по умолчанию, если файла модели нет
+DEFAULT_MODEL = {
+    "naive": {"per_window": 440.0, "per_shift": 0.0, "per_comparison": 93.0, "per_pattern_char": 0.0, "intercept": 0.0},
+    "kmp": {"per_window": 181.0, "per_shift": 0.0, "per_comparison": 56.0, "per_pattern_char": 194.0, "intercept": 0.0},
+    "bm": {"per_window": 661.0, "per_shift": 0.0, "per_comparison": 129.0,
+           "per_pattern_char": 85.0, "intercept": 27100.0},
+    "bm_suffix": {"per_window": 329.0, "per_shift": 503.0, "per_comparison": 64.0,
+                  "per_pattern_char": 699.0, "intercept": 19178.0},
+    "rk": {"per_window": 406.0, "per_shift": 0.0, "per_comparison": 47.0, "per_pattern_char": 217.0, "intercept": 0.0},
+}
+
+
+def _sample(text: str) -> str:
+    """Несколько кусков из разных мест текста, чтобы частоты не зависели только от его начала"""
+    if len(text) <= ALPHABET_SAMPLE:
+        return text
+    piece = ALPHABET_SAMPLE // SAMPLE_PIECES
+    step = (len(text) - piece) // (SAMPLE_PIECES - 1)
+    return "".join(text[i * step:i * step + piece] for i in range(SAMPLE_PIECES))
+
+
+def _match_chain(sample: str, pattern: str, p: dict, unseen: float, from_right: bool) -> list[float]:
+    """Вероятность совпадения очередного символа шаблона при условии, что совпали предыдущие
+
+    Условные вероятности считаются по числу (перекрывающихся) вхождений всё более длинных
+    префиксов (или суффиксов) шаблона в выборку, поэтому учитывают периодичность текста.
+    Позиции вхождений куска длины L получаются фильтрацией позиций куска длины L - 1.
+    Когда вхождений в выборке не остаётся, символы считаются независимыми.
+    """
+    m = len(pattern)
+    order = list(range(m - 1, -1, -1) if from_right else range(m))
+    first = pattern[order[0]]
+    # Позиция, от которой отсчитывается кусок: его последний символ справа или первый слева
+    positions = [i for i, char in enumerate(sample) if char == first]
+    chain = [len(positions) / len(sample) if positions else p.get(first, unseen)]
+    for length, i in enumerate(order[1:], start=1):
+        if positions:
+            char = pattern[i]
+            if from_right:
+                found = [pos for pos in positions if pos >= length and sample[pos - length] == char]
+            else:
+                found = [pos for pos in positions if pos + length < len(sample) and sample[pos + length] == char]
+            if found:
+                chain.append(len(found) / len(positions))
+                positions = found
+                continue
+            positions = []
+        chain.append(p.get(pattern[i], unseen))
+    return chain[::-1] if from_right else chain
+
+
+def get_features(text: str, pattern: str) -> dict:
+    """Признаки задачи: длины, период шаблона и ожидаемая работа движков в одном окне
+
+    Частоты символов и вероятности совпадения префиксов и суффиксов шаблона берутся
+    из выборки текста. По ним считаются среднее число сравнений в окне (слева направо
+    для наивного поиска, справа налево для BM) и средний сдвиг окна у bm и bm_suffix.
+    """
+    n, m = len(text), len(pattern)
+    sample = _sample(text)
+    frequencies = Counter(sample)
+    # Символ шаблона, которого нет в выборке, всё же может встретиться в тексте
+    unseen = 0.5 / max(len(sample), 1)
+    p = {char: count / len(sample) for char, count in frequencies.items()} if sample else {}
+    period = m - prefix_func(pattern)[-1] if m else 0
+    features = {"n": n, "m": m, "sigma": len(frequencies), "period": period}
+    if not m or not sample:
+        return dict(features, naive_compares=1.0, kmp_fallbacks=0.0, bm_compares=1.0, bm_shift=1.0,
+                    bm_suffix_compares=1.0, bm_suffix_shift=1.0, match_rate=0.0)
+    forward = _match_chain(sample, pattern, p, unseen, from_right=False)
+    match = _match_chain(sample, pattern, p, unseen, from_right=True)
+
+    # Наивный поиск: символ k сравнивается, если совпали все предыдущие
+    naive_compares = 0.0
+    reach = 1.0
+    kmp_fallbacks = 0.0
+    for k in range(m):
+        naive_compares += reach
+        if k:
+            # KMP откатывается по префикс-функции, когда в состоянии k следующий символ не совпал
+            kmp_fallbacks += reach * (1 - forward[k])
+        reach *= forward[k]
+        if reach < NEGLIGIBLE:
+            break
+
+    # BM: окно проверяется справа налево, несовпадение в позиции i с символом c даёт сдвиг
+    # max(1, i - last[c]) (и не меньше good_suffix[i] у bm_suffix)
+    last = get_bad_char_map(pattern)
+    good_suffix = compute_good_suffix_shift(pattern)
+    absent_mass = max(1.0 - sum(p.get(char, 0.0) for char in last), 0.0)
+    bm_compares = bm_shift = bm_suffix_shift = 0.0
+    reach = 1.0
+    for i in range(m - 1, -1, -1):
+        miss = reach * (1 - match[i])
+        if miss > 0:
+            # Несовпавший символ распределён как символы текста, кроме pattern[i]
+            total = absent_mass
+            shift = absent_mass * (i + 1)
+            suffix_shift = absent_mass * max(i + 1, good_suffix[i])
+            for char, index in last.items():
+                if char != pattern[i]:
+                    weight = p.get(char, 0.0)
+                    total += weight
+                    shift += weight * max(1, i - index)
+                    suffix_shift += weight * max(1, i - index, good_suffix[i])
+            if total <= 0:
+                total, shift, suffix_shift = 1.0, 1.0, max(1, good_suffix[i])
+            scale = miss / total
+            bm_shift += scale * shift
+            bm_suffix_shift += scale * suffix_shift
+            bm_compares += miss * (m - i)
+        reach *= match[i]
+        if reach < NEGLIGIBLE:
+            reach = 0.0
+            break
+
+    # Полное совпадение: bm сдвигается по символу за окном, bm_suffix - на период,
+    # а правило Галиля оставляет ему для проверки только period символов
+    after_match = absent_mass * (m + 1) + sum(p.get(char, 0.0) * (m - index) for char, index in last.items())
+    return dict(
+        features,
+        naive_compares=naive_compares,
+        kmp_fallbacks=kmp_fallbacks,
+        bm_compares=bm_compares + reach * m,
+        bm_shift=max(bm_shift + reach * after_match, 1.0),
+        bm_suffix_compares=bm_compares + reach * min(period, m),
+        bm_suffix_shift=max(bm_suffix_shift + reach * period, 1.0),
+        match_rate=reach,
+    )
+
+
+def estimate_work(engine: str, features: dict) -> tuple[float, float, float]:
+    """Ожидаемое число окон, сдвигов по эвристикам и дополнительных сравнений символов
+
+    Окно - шаг по тексту с первым сравнением. Сдвиг по таблицам плохого символа и
+    хорошего суффикса (после несовпадения в BM) считается отдельно: он заметно дороже
+    сдвига после полного совпадения. Дополнительные сравнения - продолжение проверки
+    окна (у KMP - откаты по префикс-функции и найденные вхождения).
+    """
+    n, m = features["n"], features["m"]
+    windows = max(n - m + 1, 0)
+    if engine == "naive":
+        return windows, 0.0, windows * (features["naive_compares"] - 1)
+    if engine == "kmp":
+        # Найденное вхождение стоит ещё одного шага: счётчик и откат по префикс-функции
+        return n, 0.0, n * (features["kmp_fallbacks"] + features["match_rate"])
+    if engine in ("bm", "bm_suffix"):
+        steps = windows / features[engine + "_shift"]
+        comparisons = max(features[engine + "_compares"] - 1, 0.0)
+        return steps, steps * (1 - features["match_rate"]), steps * comparisons
+    # Rabin-Karp пересчитывает хеш в каждом окне и сравнивает срез только при совпадении хеша
+    return windows, 0.0, windows * features["match_rate"] * m
+
+
+def _terms(engine: str, features: dict) -> tuple[float, ...]:
+    return (*estimate_work(engine, features), features["m"], 1.0)
+
+
+def predict_ns(engine: str, features: dict, model: dict) -> float:
+    coefficients = model[engine]
+    return sum(coefficients[term] * value for term, value in zip(TERMS, _terms(engine, features)))
+
+
+def load_model(path: str = DEFAULT_MODEL_PATH) -> dict:
+    """Загружает откалиброванную модель или возвращает модель по умолчанию"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return DEFAULT_MODEL
+
+
+def choose_engine(text: str, pattern: str, model: dict = None) -> str:
+    """Выбирает движок с минимальным предсказанным временем"""
+    if model is None:
+        model = load_model()
+    features = get_features(text, pattern)
+    return min(ENGINES, key=lambda engine: predict_ns(engine, features, model))
+
+
+def count(text: str, pattern: str, model: dict = None) -> int:
+    """Считает вхождения шаблона движком, выбранным по модели стоимости"""
+    if not pattern or len(pattern) > len(text):
+        return 0
+    if len(text) <= ALPHABET_SAMPLE:
+        # На коротком тексте оценка признаков дольше самого поиска
+        return ENGINES["kmp"](text, pattern)
+    return ENGINES[choose_engine(text, pattern, model)](text, pattern)
+
+
+def _calibration_workloads(seed: int = 1):
+    """(текст, шаблон): случайные тексты разных алфавитов, неравномерный текст,
+    естественный текст и периодичные строки"""
+    rng = random.Random(seed)
+    for sigma in (2, 4, 26, 64):
+        alphabet = [chr(ord("a") + i) if i < 26 else chr(ord("а") + i - 26) for i in range(sigma)]
+        for n in (2000, 20000):
+            text = "".join(rng.choice(alphabet) for _ in range(n))
+            for m in (3, 8, 32):
+                yield text, "".join(rng.choice(alphabet) for _ in range(m))
+                start = rng.randrange(n - m)
+                yield text, text[start:start + m]
+    skewed = "".join(rng.choices("etaoinshrdlu ", weights=range(13, 0, -1), k=20000))
+    for m in (2, 5, 12):
+        yield skewed, skewed[100:100 + m]
+    for text, pattern in corpus_workloads(copies=2):
+        yield text, pattern
+    yield "a" * 20000, "a" * 8
+    yield "a" * 20000, "b" * 8 + "a"
+    yield "ab" * 10000, "ab" * 4
+
+
+def corpus_workloads(copies: int = 20, path: str = CORPUS_PATH):
+    """(текст, шаблон) на тексте tests/search/test.txt, повторённом copies раз"""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read() * copies
+    for pattern in ("дуб", "князь Андрей", "е", "ст", "березы", "несимметрично растопыренными"):
+        yield text, pattern
+
+
+def _measure_ns(func, text: str, pattern: str, repeats: int) -> int:
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        func(text, pattern)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _measure_engines(text: str, pattern: str, repeats: int) -> dict:
+    """Лучшее время каждого движка; движки замеряются по кругу, чтобы дрейф скорости
+    машины во время калибровки одинаково сказывался на всех"""
+    best = {}
+    for _ in range(repeats):
+        for engine, func in ENGINES.items():
+            elapsed = _measure_ns(func, text, pattern, 1)
+            best[engine] = min(best.get(engine, elapsed), elapsed)
+    return best
+
+
+def _solve(matrix: list, vector: list) -> list:
+    """Решает систему линейных уравнений методом Гаусса с выбором главного элемента"""
+    size = len(vector)
+    rows = [list(row) + [value] for row, value in zip(matrix, vector)]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda row: abs(rows[row][column]))
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        if abs(rows[column][column]) < 1e-12:
+            continue
+        for row in range(size):
+            if row != column:
+                factor = rows[row][column] / rows[column][column]
+                rows[row] = [a - factor * b for a, b in zip(rows[row], rows[column])]
+    return [rows[i][size] / rows[i][i] if abs(rows[i][i]) >= 1e-12 else 0.0 for i in range(size)]
+
+
+def _fit(samples: list) -> list:
+    """Неотрицательные коэффициенты по парам (признаки, время) методом наименьших квадратов
+
+    Минимизируется относительная ошибка (строки делятся на измеренное время), потому что
+    выбор движка зависит от отношения времён. Признаки с отрицательным коэффициентом
+    по одному выбрасываются из модели, пока все коэффициенты не станут неотрицательными.
+    """
+    size = len(samples[0][0])
+    active = list(range(size))
+    while True:
+        gram = [[0.0] * len(active) for _ in active]
+        moment = [0.0] * len(active)
+        for terms, elapsed in samples:
+            row = [terms[i] / elapsed for i in active]
+            for a in range(len(active)):
+                moment[a] += row[a]
+                for b in range(len(active)):
+                    gram[a][b] += row[a] * row[b]
+        solution = _solve(gram, moment)
+        worst = min(range(len(active)), key=lambda i: solution[i])
+        if solution[worst] >= 0 or len(active) == 1:
+            coefficients = [0.0] * size
+            for index, value in zip(active, solution):
+                coefficients[index] = max(value, 0.0)
+            return coefficients
+        del active[worst]
+
+
+def _boyer_moore_work(text: str, pattern: str, with_suffix: bool) -> tuple[int, int, int]:
+    """Точное число окон, сдвигов по эвристикам и дополнительных сравнений bm (или bm_suffix)"""
+    bad_char = get_bad_char_map(pattern)
+    good_suffix = compute_good_suffix_shift(pattern)
+    n, m = len(text), len(pattern)
+    shift = windows = shifts = comparisons = known = 0
+    while shift <= n - m:
+        windows += 1
+        i = m - 1
+        while i >= known and pattern[i] == text[shift + i]:
+            i -= 1
+        comparisons += m - 1 - i
+        if i < known:
+            if with_suffix:
+                shift += good_suffix[0]
+                known = m - good_suffix[0]
+            else:
+                shift += m - bad_char.get(text[shift + m], -1) if shift + m < n else 1
+        else:
+            known = 0
+            shifts += 1
+            shift += max(1, i - bad_char.get(text[shift + i], -1), good_suffix[i] if with_suffix else 1)
+    return windows, shifts, comparisons
+
+
+def _actual_work(engine: str, text: str, pattern: str) -> tuple[float, float, float]:
+    """Фактические (окна, сдвиги, дополнительные сравнения) - по ним подбираются коэффициенты,
+    чтобы ошибки оценки estimate_work не попадали в стоимость операций"""
+    n, m = len(text), len(pattern)
+    windows = n - m + 1
+    if engine == "naive":
+        return windows, 0, naive_find(text, pattern)[1] - windows
+    if engine == "kmp":
+        found, steps = kmp(text, pattern)
+        return n, 0, steps - n + found
+    if engine in ("bm", "bm_suffix"):
+        return _boyer_moore_work(text, pattern, engine == "bm_suffix")
+    return windows, 0, get_substring_rk(text, pattern) * m
+
+
+def _setup_ns_per_char(engine: str, repeats: int) -> float:
+    """Стоимость предобработки на символ шаблона - по построению таблиц из compiled_search"""
+    if engine not in TABLE_BUILDERS:
+        return 0.0
+    pattern = "".join(random.Random(0).choice("abcd") for _ in range(4096))
+    build_tables = TABLE_BUILDERS[engine][0]
+    return _measure_ns(lambda text, pattern: build_tables(pattern), "", pattern, repeats) / len(pattern)
+
+
+def calibrate(path: str = DEFAULT_MODEL_PATH, repeats: int = 5) -> dict:
+    """Прогоняет встроенный микробенчмарк и сохраняет коэффициенты модели в path
+
+    Стоимость символа шаблона измеряется отдельно по построению таблиц; стоимость окна,
+    дополнительного сравнения и постоянная часть подбираются для каждого движка по
+    измеренным временам поиска за вычетом предобработки.
+    """
+    times = [(text, pattern, _measure_engines(text, pattern, repeats)) for text, pattern in _calibration_workloads()]
+    model = {}
+    for engine in ENGINES:
+        per_pattern_char = _setup_ns_per_char(engine, repeats)
+        samples = []
+        for text, pattern, elapsed in times:
+            windows, shifts, comparisons = _actual_work(engine, text, pattern)
+            samples.append(((windows, shifts, comparisons, 1.0),
+                            max(elapsed[engine] - per_pattern_char * len(pattern), 1.0)))
+        per_window, per_shift, per_comparison, intercept = _fit(samples)
+        model[engine] = {
+            "per_window": round(per_window, 3),
+            "per_shift": round(per_shift, 3),
+            "per_comparison": round(per_comparison, 3),
+            "per_pattern_char": round(per_pattern_char, 3),
+            "intercept": round(intercept, 3),
+        }
+
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(model, f, indent=4)
+    return model
+
+
+def evaluate(workloads, model: dict = None, repeats: int = 5) -> list[tuple[str, str, str, float]]:
+    """Проверка планировщика: для каждой задачи (текст, шаблон) измеряет все движки и
+    возвращает (шаблон, выбранный движок, самый быстрый движок, во сколько раз выбранный медленнее)"""
+    if model is None:
+        model = load_model()
+    report = []
+    for text, pattern in workloads:
+        times = _measure_engines(text, pattern, repeats)
+        chosen = choose_engine(text, pattern, model)
+        best = min(times, key=times.get)
+        report.append((pattern, chosen, best, times[chosen] / times[best]))
+    return report
+
+
+if __name__ == "__main__":
+    model = calibrate() if os.environ.get("RECALIBRATE") else load_model()
+    print(json.dumps(model, indent=4))
+    for text, pattern in [("a" * 10000, "aaa"), ("abababacab" * 1000, "babac"),
+                          ("на краю дороги стоял дуб " * 400, "дуб")]:
+        print(f"'{pattern}': {choose_engine(text, pattern, model)} -> {count(text, pattern, model)}")
+
+    # Выбранный движок должен быть не медленнее лучшего больше чем в CHECK_TOLERANCE раза
+    for name, workloads in (("calibration", _calibration_workloads()), ("test.txt x20", corpus_workloads())):
+        report = evaluate(workloads, model)
+        slow = [row for row in report if row[3] > CHECK_TOLERANCE]
+        print(f"{name}: within {CHECK_TOLERANCE}x of the best engine on {len(report) - len(slow)}/{len(report)}")
+        for pattern, chosen, best, ratio in slow:
+            print(f"    '{pattern[:20]}': {chosen} is {ratio:.2f}x slower than {best}")
@@ -0,0 +1,48 @@
+from itertools import islice
+
+from Lab4.KMP_search import kmp, kmp_iter
+from Lab5.BM_search import bm, bm_iter
+from Lab5.BM_search_with_suffix import bm_suffix, bm_suffix_iter
+from Lab6.RK_search import get_substring_rk, get_substring_rk_iter
+from Search.naive import naive_find, naive_iter
+
+# Все движки приведены к одному виду: (текст, шаблон) -> количество вхождений
+ENGINES = {
+    "naive": lambda text, pattern: naive_find(text, pattern)[0],
+    "kmp": lambda text, pattern: kmp(text, pattern)[0],
+    "bm": lambda text, pattern: bm(text, pattern)[0],
+    "bm_suffix": lambda text, pattern: bm_suffix(text, pattern, linear=True)[0],
+    "rk": get_substring_rk,
+}
+
+# Генераторы позиций; для одного только подсчёта быстрее исходные функции движков
+ITERATORS = {
+    "naive": naive_iter,
+    "kmp": kmp_iter,
+    "bm": bm_iter,
+    "bm_suffix": bm_suffix_iter,
+    "rk": get_substring_rk_iter,
+}
+
+
+def iter_positions(text: str, pattern: str, algorithm: str = "kmp"):
+    """Лениво выдаёт позиции вхождений выбранным алгоритмом"""
+    if algorithm not in ITERATORS:
+        raise ValueError(f"iter_positions: unknown algorithm {algorithm!r}, expected one of {list(ITERATORS)}.")
+    return ITERATORS[algorithm](text, pattern)
+
+
+def find_first(text: str, pattern: str, algorithm: str = "kmp") -> int:
+    """Позиция первого вхождения или -1, как у str.find; дальше первого вхождения текст не читается"""
+    return next(iter_positions(text, pattern, algorithm), -1)
+
+
+def find_all(text: str, pattern: str, algorithm: str = "kmp", limit: int = None) -> list[int]:
+    """Позиции вхождений; при limit поиск останавливается после первых limit вхождений"""
+    return list(islice(iter_positions(text, pattern, algorithm), limit))
+
+
+if __name__ == "__main__":
+    text = "abababacab"
+    for name in ITERATORS:
+        print(name, find_first(text, "aba", name), find_all(text, "aba", name), find_all(text, "aba", name, limit=2))
@@ -0,0 +1,236 @@
+import sys
+
+
+class StateLimitError(RuntimeError):
+    """Автомат достиг заданного пользователем max_states"""
+
+
+class SuffixAutomaton:
+    """Онлайн суффиксный автомат для текста, который только дописывается в конец
+
+    Добавление символа - амортизированно O(1), проверка вхождения - O(m).
+    Число вхождений (размер endpos) считается при первом count() одним проходом по всем
+    состояниям, а дальше поддерживается при каждом добавлении: дерево суффиксных ссылок
+    хранится как link-cut дерево, новое состояние прибавляет 1 на пути к корню, а клон
+    получает счётчик расщепляемого состояния. После этого добавление символа стоит
+    амортизированно O(log states), а count() - O(m + log states). Пока count() не
+    вызывался, добавление не платит за поддержку счётчиков.
+
+    При max_states автомат не превышает лимит: перед каждым символом проверяется место
+    под два новых состояния, и при нехватке бросается StateLimitError, а автомат остаётся
+    корректным для уже добавленной части текста.
+    """
+
+    def __init__(self, max_states: int = None):
+        self.next = [{}]  # Переходы состояния
+        self.link = [-1]  # Суффиксная ссылка
+        self.length = [0]  # Длина самой длинной строки состояния
+        self.own = [0]  # 1 для состояний, созданных добавлением символа (не клонов)
+        self.last = 0
+        self.size = 0  # Длина обработанного текста
+        self.max_states = max_states
+        # Link-cut дерево над суффиксными ссылками: потомки в splay-дереве, родитель
+        # (в splay-дереве или по суффиксной ссылке), счётчик и отложенная прибавка потомкам
+        self._left = self._right = self._parent = self._value = self._lazy = None
+
+    def _new_state(self, length: int, link: int, transitions: dict, own: int) -> int:
+        self.next.append(transitions)
+        self.link.append(link)
+        self.length.append(length)
+        self.own.append(own)
+        if self._value is not None:
+            self._left.append(-1)
+            self._right.append(-1)
+            self._parent.append(-1)
+            self._value.append(0)
+            self._lazy.append(0)
+        return len(self.next) - 1
+
+    def extend(self, chunk):
+        """Дописывает кусок текста"""
+        next_, link, length = self.next, self.link, self.length
+        for char in chunk:
+            # Символ добавляет не больше двух состояний (новое и, возможно, клон)
+            if self.max_states is not None and len(next_) + 2 > self.max_states:
+                raise StateLimitError(f"SuffixAutomaton: state limit {self.max_states} reached.")
+            current = self._new_state(length[self.last] + 1, -1, {}, 1)
+            state = self.last
+            clone = target = -1
+            while state != -1 and char not in next_[state]:
+                next_[state][char] = current
+                state = link[state]
+
+            if state == -1:
+                link[current] = 0
+            else:
+                target = next_[state][char]
+                if length[state] + 1 == length[target]:
+                    link[current] = target
+                else:
+                    # Расщепляем состояние target, чтобы сохранить корректность длин
+                    clone = self._new_state(length[state] + 1, link[target], dict(next_[target]), 0)
+                    while state != -1 and next_[state].get(char) == target:
+                        next_[state][char] = clone
+                        state = link[state]
+                    link[target] = clone
+                    link[current] = clone
+            self.last = current
+            self.size += 1
+            if self._value is not None:
+                if clone != -1:
+                    # endpos клона совпадает с endpos target, а target переезжает под клон
+                    self._value[clone] = self._query(target)
+                    self._parent[clone] = link[clone]
+                    self._cut(target)
+                    self._parent[target] = clone
+                self._parent[current] = link[current]
+                self._add_to_root(current, 1)
+
+    def _find_state(self, pattern) -> int:
+        state = 0
+        for char in pattern:
+            state = self.next[state].get(char, -1)
+            if state == -1:
+                return -1
+        return state
+
+    def contains(self, pattern) -> bool:
+        return self._find_state(pattern) != -1
+
+    def _build_counts(self) -> None:
+        # Размер endpos: сумма own по дереву суффиксных ссылок, от длинных состояний к коротким
+        occ = list(self.own)
+        buckets = [[] for _ in range(self.size + 1)]
+        for state, state_length in enumerate(self.length):
+            buckets[state_length].append(state)
+        for bucket in reversed(buckets):
+            for state in bucket:
+                if self.link[state] > 0:
+                    occ[self.link[state]] += occ[state]
+        # Каждое состояние - отдельный путь, связанный с родителем суффиксной ссылкой
+        states = len(self.next)
+        self._left, self._right = [-1] * states, [-1] * states
+        self._parent, self._value, self._lazy = list(self.link), occ, [0] * states
+
+    def _is_splay_root(self, x: int) -> bool:
+        parent = self._parent[x]
+        return parent == -1 or (self._left[parent] != x and self._right[parent] != x)
+
+    def _push(self, x: int) -> None:
+        lazy = self._lazy[x]
+        if lazy:
+            for child in (self._left[x], self._right[x]):
+                if child != -1:
+                    self._value[child] += lazy
+                    self._lazy[child] += lazy
+            self._lazy[x] = 0
+
+    def _rotate(self, x: int) -> None:
+        left, right, parent_ = self._left, self._right, self._parent
+        parent = parent_[x]
+        grandparent = parent_[parent]
+        if not self._is_splay_root(parent):
+            if left[grandparent] == parent:
+                left[grandparent] = x
+            else:
+                right[grandparent] = x
+        parent_[x] = grandparent
+        if left[parent] == x:
+            child = right[x]
+            left[parent], right[x] = child, parent
+        else:
+            child = left[x]
+            right[parent], left[x] = child, parent
+        if child != -1:
+            parent_[child] = parent
+        parent_[parent] = x
+
+    def _splay(self, x: int) -> None:
+        path = [x]
+        while not self._is_splay_root(path[-1]):
+            path.append(self._parent[path[-1]])
+        for node in reversed(path):
+            self._push(node)
+        while not self._is_splay_root(x):
+            parent = self._parent[x]
+            if not self._is_splay_root(parent):
+                grandparent = self._parent[parent]
+                zig_zig = (self._left[grandparent] == parent) == (self._left[parent] == x)
+                self._rotate(parent if zig_zig else x)
+            self._rotate(x)
+
+    def _access(self, x: int) -> None:
+        """Делает путь от корня до x одним splay-деревом с корнем x"""
+        last, node = -1, x
+        while node != -1:
+            self._splay(node)
+            self._right[node] = last
+            last, node = node, self._parent[node]
+        self._splay(x)
+
+    def _query(self, x: int) -> int:
+        self._access(x)
+        return self._value[x]
+
+    def _add_to_root(self, x: int, delta: int) -> None:
+        self._access(x)
+        self._value[x] += delta
+        self._lazy[x] += delta
+
+    def _cut(self, x: int) -> None:
+        """Отрезает x от родителя по суффиксной ссылке; x остаётся корнем своего splay-дерева"""
+        self._access(x)
+        left = self._left[x]
+        if left != -1:
+            self._parent[left] = -1
+            self._left[x] = -1
+
+    def count(self, pattern) -> int:
+        """Число вхождений pattern во весь добавленный текст"""
+        if not pattern:
+            return 0
+        state = self._find_state(pattern)
+        if state == -1:
+            return 0
+        if self._value is None:
+            self._build_counts()
+        return self._query(state)
+
+    def longest_common_substring(self, query) -> tuple[int, int]:
+        """Самая длинная общая подстрока текста и query: (длина, позиция начала в query)"""
+        next_, link, length = self.next, self.link, self.length
+        state = 0
+        current = 0
+        best, best_end = 0, 0
+        for i, char in enumerate(query):
+            while state != 0 and char not in next_[state]:
+                state = link[state]
+                current = length[state]
+            if char in next_[state]:
+                state = next_[state][char]
+                current += 1
+            if current > best:
+                best, best_end = current, i + 1
+        return best, best_end - best
+
+    @property
+    def states(self) -> int:
+        return len(self.next)
+
+    def memory_usage(self) -> dict:
+        """Оценка памяти в байтах: всего и в среднем на состояние"""
+        total = sum(sys.getsizeof(transitions) for transitions in self.next)
+        tables = (self.next, self.link, self.length, self.own, self._left, self._right,
+                  self._parent, self._value, self._lazy)
+        total += sum(sys.getsizeof(table) for table in tables if table is not None)
+        return {"states": self.states, "bytes": total, "bytes_per_state": total / self.states}
+
+
+if __name__ == "__main__":
+    automaton = SuffixAutomaton()
+    automaton.extend("abcab")
+    print(automaton.contains("ca"), automaton.count("ab"))  # True 2
+    automaton.extend("cabd")
+    print(automaton.count("ab"), automaton.count("cab"))  # 3 2
+    print(automaton.longest_common_substring("xxbcabdx"))  # (5, 2)
+    print(automaton.memory_usage())
@@ -0,0 +1,284 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+MAGIC = b"SAINDEX1"
+# Код, которого нет ни у одного символа Unicode: им помечается конец текста в BWT
+SENTINEL = 0xFFFFFFFF
+OCC_STEP = 64
+
+
+def text_to_codes(text: str) -> array:
+    """Коды символов текста в компактном массиве (4 байта на символ)"""
+    codes = array("I")
+    codes.frombytes(text.encode("utf-32-le" if sys.byteorder == "little" else "utf-32-be"))
+    return codes
+
+
+def _sa_is(s: list, upper: int) -> list:
+    """SA-IS (Nong, Zhang, Chan) для строки целых чисел из [0, upper], O(n)
+
+    Суффиксы делятся на S- и L-типы; LMS-суффиксы (S, перед которым стоит L) сортируются
+    рекурсивно по сжатой строке из LMS-подстрок, а остальные суффиксы расставляются
+    по корзинам первых символов индуцированной сортировкой за два прохода.
+    """
+    n = len(s)
+    if n < 3:
+        return sorted(range(n), key=lambda i: s[i:])
+
+    # is_s[i] - суффикс i меньше суффикса i + 1 (S-тип); последний суффикс - L-тип
+    is_s = [False] * n
+    for i in range(n - 2, -1, -1):
+        is_s[i] = is_s[i + 1] if s[i] == s[i + 1] else s[i] < s[i + 1]
+
+    # Границы корзин: в корзине символа c сначала L-суффиксы (с bucket_l[c]), потом S (с bucket_s[c])
+    bucket_l = [0] * (upper + 2)
+    bucket_s = [0] * (upper + 2)
+    for i in range(n):
+        if is_s[i]:
+            bucket_l[s[i] + 1] += 1
+        else:
+            bucket_s[s[i]] += 1
+    for c in range(upper + 1):
+        bucket_s[c] += bucket_l[c]
+        bucket_l[c + 1] += bucket_s[c]
+
+    sa = [-1] * n
+
+    def induce(lms: list) -> None:
+        sa[:] = [-1] * n
+        heads = bucket_s[:]
+        for i in lms:
+            sa[heads[s[i]]] = i
+            heads[s[i]] += 1
+        # L-суффиксы слева направо от начала их корзин
+        heads = bucket_l[:]
+        sa[heads[s[n - 1]]] = n - 1
+        heads[s[n - 1]] += 1
+        for v in sa:
+            if v >= 1 and not is_s[v - 1]:
+                sa[heads[s[v - 1]]] = v - 1
+                heads[s[v - 1]] += 1
+        # S-суффиксы справа налево от концов их корзин
+        tails = bucket_l[:]
+        for j in range(n - 1, -1, -1):
+            v = sa[j]
+            if v >= 1 and is_s[v - 1]:
+                tails[s[v - 1] + 1] -= 1
+                sa[tails[s[v - 1] + 1]] = v - 1
+
+    lms = [i for i in range(1, n) if is_s[i] and not is_s[i - 1]]
+    lms_index = [-1] * n
+    for j, i in enumerate(lms):
+        lms_index[i] = j
+    induce(lms)
+
+    m = len(lms)
+    if m:
+        # Имена LMS-подстрок в порядке после индуцированной сортировки
+        sorted_lms = [v for v in sa if lms_index[v] != -1]
+        reduced = [0] * m
+        name = 0
+        for j in range(1, m):
+            left, right = sorted_lms[j - 1], sorted_lms[j]
+            end_left = lms[lms_index[left] + 1] if lms_index[left] + 1 < m else n
+            end_right = lms[lms_index[right] + 1] if lms_index[right] + 1 < m else n
+            same = end_left - left == end_right - right
+            if same:
+                while left < end_left and s[left] == s[right]:
+                    left += 1
+                    right += 1
+                same = left < n and s[left] == s[right] if left == end_left else False
+            if not same:
+                name += 1
+            reduced[lms_index[sorted_lms[j]]] = name
+        # Имена не уникальны - порядок LMS-суффиксов находится рекурсивно
+        reduced_sa = _sa_is(reduced, name)
+        induce([lms[j] for j in reduced_sa])
+    return sa
+
+
+def build_suffix_array(codes) -> array:
+    """Суффиксный массив алгоритмом SA-IS за O(n); коды предварительно сжимаются в ранги"""
+    ranks = {code: rank for rank, code in enumerate(sorted(set(codes)))}
+    return array("i", _sa_is([ranks[code] for code in codes], max(len(ranks) - 1, 0)))
+
+
+class SuffixIndex:
+    """Индекс по неизменному тексту: суффиксный массив и (опционально) FM-индекс
+
+    В FM-индексе строки упорядочены с виртуальным суффиксом-сентинелом в строке 0,
+    поэтому строка r соответствует суффиксу sa[r - 1].
+    """
+
+    def __init__(self, codes, sa, fm: dict = None):
+        self.codes = codes
+        self.sa = sa
+        self.fm = fm
+
+    @classmethod
+    def build(cls, text: str, with_fm: bool = False) -> "SuffixIndex":
+        codes = text_to_codes(text)
+        sa = build_suffix_array(codes)
+        index = cls(codes, sa)
+        if with_fm:
+            index.fm = index._build_fm()
+        return index
+
+    def __len__(self):
+        return len(self.codes)
+
+    def _build_fm(self) -> dict:
+        codes, sa = self.codes, self.sa
+        n = len(codes)
+        bwt = array("I", [codes[n - 1] if n else SENTINEL])
+        bwt.extend(codes[i - 1] if i > 0 else SENTINEL for i in sa)
+
+        alphabet = sorted(set(codes))
+        # C[c] - число строк, суффикс которых начинается с символа меньше c (с учётом сентинела)
+        counts = {code: 0 for code in alphabet}
+        for code in codes:
+            counts[code] += 1
+        first_row = {}
+        total = 1
+        for code in alphabet:
+            first_row[code] = total
+            total += counts[code]
+
+        # Контрольные точки occ: сколько раз символ встретился в bwt[0:k*OCC_STEP]
+        checkpoints = len(bwt) // OCC_STEP + 1
+        symbol_index = {code: i for i, code in enumerate(alphabet)}
+        occ = array("i", bytes(4 * len(alphabet) * checkpoints))
+        running = [0] * len(alphabet)
+        for row, code in enumerate(bwt):
+            if row % OCC_STEP == 0:
+                for i, value in enumerate(running):
+                    occ[i * checkpoints + row // OCC_STEP] = value
+            if code != SENTINEL:
+                running[symbol_index[code]] += 1
+        if len(bwt) % OCC_STEP == 0:
+            for i, value in enumerate(running):
+                occ[i * checkpoints + len(bwt) // OCC_STEP] = value
+
+        return {"bwt": bwt, "first_row": first_row, "symbol_index": symbol_index,
+                "checkpoints": checkpoints, "occ": occ}
+
+    def _occ(self, code: int, row: int) -> int:
+        """Сколько раз символ code встречается в bwt[0:row]"""
+        fm = self.fm
+        checkpoint = row // OCC_STEP
+        base = fm["occ"][fm["symbol_index"][code] * fm["checkpoints"] + checkpoint]
+        return base + fm["bwt"][checkpoint * OCC_STEP:row].tolist().count(code)
+
+    def _range_fm(self, pattern_codes) -> tuple[int, int]:
+        """Обратный поиск по FM-индексу за O(m), возвращает диапазон строк [lo, hi)"""
+        lo, hi = 0, len(self.codes) + 1
+        for code in reversed(pattern_codes):
+            if code not in self.fm["first_row"]:
+                return 0, 0
+            start = self.fm["first_row"][code]
+            lo = start + self._occ(code, lo)
+            hi = start + self._occ(code, hi)
+            if lo >= hi:
+                return 0, 0
+        return lo - 1, hi - 1
+
+    def _range_sa(self, pattern_codes) -> tuple[int, int]:
+        """Двоичный поиск по суффиксному массиву за O(m log n)"""
+        codes, sa = self.codes, self.sa
+        m = len(pattern_codes)
+
+        lo, hi = 0, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if codes[sa[mid]:sa[mid] + m].tolist() < pattern_codes:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+
+        hi = len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if codes[sa[mid]:sa[mid] + m].tolist() == pattern_codes:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def _range(self, pattern: str) -> tuple[int, int]:
+        pattern_codes = text_to_codes(pattern).tolist()
+        if self.fm is not None:
+            return self._range_fm(pattern_codes)
+        return self._range_sa(pattern_codes)
+
+    def count(self, pattern: str) -> int:
+        if not pattern:
+            return 0
+        lo, hi = self._range(pattern)
+        return hi - lo
+
+    def positions(self, pattern: str) -> list[int]:
+        """Позиции вхождений в порядке возрастания"""
+        if not pattern:
+            return []
+        lo, hi = self._range(pattern)
+        return sorted(self.sa[lo:hi])
+
+    def save(self, path: str):
+        """Сохраняет индекс так, чтобы load мог отобразить таблицы в память без копирования"""
+        header = {"n": len(self.codes), "fm": self.fm is not None}
+        tables = [self.codes, self.sa]
+        if self.fm is not None:
+            header["first_row"] = list(self.fm["first_row"].items())
+            header["checkpoints"] = self.fm["checkpoints"]
+            tables += [self.fm["bwt"], self.fm["occ"]]
+        header = json.dumps(header).encode("utf-8")
+        padding = b"\0" * (-(len(MAGIC) + 8 + len(header)) % 4)
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            f.write(padding)
+            for table in tables:
+                f.write(table.tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> "SuffixIndex":
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path}: not a suffix index.")
+        (header_len,) = struct.unpack_from("<Q", mm, len(MAGIC))
+        start = len(MAGIC) + 8
+        header = json.loads(mm[start:start + header_len].decode("utf-8"))
+        start += header_len
+        start += -start % 4
+
+        n = header["n"]
+        view = memoryview(mm)
+        codes = view[start:start + 4 * n].cast("I")
+        start += 4 * n
+        sa = view[start:start + 4 * n].cast("i")
+        start += 4 * n
+
+        fm = None
+        if header["fm"]:
+            first_row = dict(header["first_row"])
+            checkpoints = header["checkpoints"]
+            bwt = view[start:start + 4 * (n + 1)].cast("I")
+            start += 4 * (n + 1)
+            occ = view[start:start + 4 * len(first_row) * checkpoints].cast("i")
+            fm = {"bwt": bwt, "first_row": first_row, "checkpoints": checkpoints, "occ": occ,
+                  "symbol_index": {code: i for i, code in enumerate(first_row)}}
+        return cls(codes, sa, fm)
+
+
+if __name__ == "__main__":
+    with open("tests/search/test.txt", "r", encoding="utf-8") as f:
+        corpus = f.read()
+    index = SuffixIndex.build(corpus, with_fm=True)
+    for word in ("дуб", "князь", "небо"):
+        print(word, index.count(word), index.positions(word)[:5])
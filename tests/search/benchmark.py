@@ -0,0 +1,151 @@
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import time
+
+from Lab4.KMP_search import kmp
+from Lab4.bitap_search import bitap
+from Lab5.BM_search import bm
+from Lab5.BM_search_with_suffix import bm_suffix
+from Lab6.RK_search import get_substring_rk
+from Search.naive import naive_find
+from workloads import ALPHABETS, fibonacci_word, matching_patterns, random_text, take, thue_morse, zipf_text
+
+# Те же алгоритмы, что и в словаре algorithms из test.py
+ALGORITHMS = {
+    "Naive": naive_find,
+    "KMP": kmp,
+    "BM": bm,
+    "BM_suffix": bm_suffix,
+    "RK": get_substring_rk,
+    "Bitap": bitap,
+}
+
+
+def measure(func, *args, warmup: int = 2, repeats: int = 15, disable_gc: bool = True) -> dict:
+    """Замеряет функцию repeats раз через perf_counter_ns и возвращает медиану и IQR в наносекундах"""
+    for _ in range(warmup):
+        func(*args)
+
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter_ns()
+            func(*args)
+            samples.append(time.perf_counter_ns() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    q1, median, q3 = statistics.quantiles(samples, n=4) if repeats > 1 else (samples[0],) * 3
+    return {
+        "median_ns": median,
+        "q1_ns": q1,
+        "q3_ns": q3,
+        "iqr_ns": q3 - q1,
+        "min_ns": min(samples),
+        "repeats": repeats,
+    }
+
+
+def make_workloads(text_sizes=(1000, 10000), pattern_lengths=(3, 10, 50), alphabets=tuple(ALPHABETS),
+                   seed: int = 0):
+    """Генерирует (имя, текст, шаблон) для всех сочетаний параметров; результат зависит только от seed
+
+    Тексты строятся генераторами из workloads.py: случайные над алфавитами, слова
+    Фибоначчи и Туэ-Морса и похожий на естественный текст по закону Ципфа.
+    """
+    for index, alphabet_name in enumerate(alphabets):
+        for n in text_sizes:
+            text = take(random_text(n, ALPHABETS[alphabet_name], seed=seed + index))
+            for m in pattern_lengths:
+                # Шаблон берём из текста, чтобы было хотя бы одно вхождение
+                pattern, = matching_patterns(text, 1, min(m, n), seed=seed + m)
+                yield f"{alphabet_name}/n={n}/m={m}", text, pattern
+    for name, generator in (("fibonacci", fibonacci_word), ("thue_morse", thue_morse),
+                            ("zipf", lambda n: zipf_text(n, seed=seed))):
+        for n in text_sizes:
+            text = take(generator(n))
+            for m in pattern_lengths:
+                pattern, = matching_patterns(text, 1, min(m, n), seed=seed + m)
+                yield f"{name}/n={n}/m={m}", text, pattern
+    # Худший случай для наивного поиска и BM, как в test.py
+    for n in text_sizes:
+        yield f"periodic/n={n}/m=3", "a" * n, "aaa"
+        yield f"periodic/n={n}/m=51", "a" * n, "b" * 50 + "a"
+
+
+def run_suite(workloads, algorithms=None, **measure_kwargs) -> dict:
+    if algorithms is None:
+        algorithms = ALGORITHMS
+    results = {}
+    for name, text, pattern in workloads:
+        results[name] = {}
+        for algo_name, func in algorithms.items():
+            results[name][algo_name] = measure(func, text, pattern, **measure_kwargs)
+    return results
+
+
+def save_results(results: dict, path: str):
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def compare(results: dict, baseline: dict, threshold: float = 0.1) -> list:
+    """Ищет регрессии: медиана выросла больше чем на threshold и интервалы IQR не пересекаются"""
+    regressions = []
+    for name, algos in results.items():
+        for algo_name, current in algos.items():
+            previous = baseline.get(name, {}).get(algo_name)
+            if previous is None:
+                continue
+            ratio = current["median_ns"] / previous["median_ns"]
+            if ratio > 1 + threshold and current["q1_ns"] > previous["q3_ns"]:
+                regressions.append((name, algo_name, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк алгоритмов поиска подстрок")
+    parser.add_argument("--output", default="bench_results.json", help="куда сохранить результаты")
+    parser.add_argument("--baseline", help="JSON с прошлыми результатами для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.1, help="допустимый рост медианы")
+    parser.add_argument("--repeats", type=int, default=15)
+    parser.add_argument("--quick", action="store_true", help="только маленькие тексты")
+    args = parser.parse_args()
+
+    text_sizes = (1000,) if args.quick else (1000, 10000)
+    results = run_suite(make_workloads(text_sizes=text_sizes), repeats=args.repeats)
+    save_results(results, args.output)
+
+    for name, algos in results.items():
+        print(f"\n[{name}]")
+        for algo_name, stats in algos.items():
+            print(f"{algo_name}: медиана {stats['median_ns'] / 1e6:.4f} мс, IQR {stats['iqr_ns'] / 1e6:.4f} мс")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        print("\n" + "=" * 50)
+        for name, algo_name, ratio in regressions:
+            print(f"РЕГРЕССИЯ {name} {algo_name}: в {ratio:.2f} раза медленнее")
+        if not regressions:
+            print("Регрессий не найдено")
+        raise SystemExit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
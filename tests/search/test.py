@@ -1,8 +1,9 @@
 from Lab4.KMP_search import kmp, prefix_func
+from Lab4.bitap_search import bitap
 from Lab5.BM_search import bm
 from Lab5.BM_search_with_suffix import bm_suffix
 from Lab6.RK_search import get_substring_rk
-from naive import naive_find
+from Search.naive import naive_find
 from timer import timer_decorator
 
 
@@ -36,6 +37,7 @@ def run_tests():
         "BM": timer_decorator(bm),
         "BM_suffix": timer_decorator(bm_suffix),
         "RK": timer_decorator(get_substring_rk),
+        "Bitap": timer_decorator(bitap),
     }
 
     # Тест 2: Поиск в строке ex_str2
@@ -3,14 +3,14 @@ from functools import wraps
 
 
 def timer_decorator(func):
-    """Декоратор для измерения времени выполнения функции"""
+    """Декоратор для измерения времени выполнения функции (один замер, для точных цифр см. benchmark.py)"""
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        execution_time = (end_time - start_time) * 1000  # в миллисекундах
+        end_time = time.perf_counter_ns()
+        execution_time = (end_time - start_time) / 1e6  # в миллисекундах
         print(f"Время выполнения {func.__name__}: {execution_time:.5f} мс")
         return result
 
@@ -0,0 +1,171 @@
+import random
+from itertools import islice
+
+# Все генераторы выдают текст кусками по chunk_size символов, поэтому их можно сразу
+# писать на диск (write_chunks) и получать файлы в гигабайты без хранения в памяти.
+# Результат зависит только от параметров и seed.
+CHUNK_SIZE = 1 << 16
+
+ALPHABETS = {
+    "binary": "ab",
+    "dna": "acgt",
+    "latin": "abcdefghijklmnopqrstuvwxyz",
+    "cyrillic": "абвгдеёжзийклмнопрстуфхцчшщъыьэюя",
+}
+
+
+def _chunked(chars, length: int, chunk_size: int = CHUNK_SIZE):
+    """Собирает поток символов (или строк) в куски ровно по chunk_size символов"""
+    buffer = []
+    buffered = 0
+    produced = 0
+    for piece in chars:
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            data = "".join(buffer)
+            while len(data) >= chunk_size and produced < length:
+                chunk = data[:min(chunk_size, length - produced)]
+                produced += len(chunk)
+                yield chunk
+                data = data[len(chunk):]
+            buffer, buffered = [data], len(data)
+        if produced >= length:
+            return
+    data = "".join(buffer)[:length - produced]
+    if data:
+        yield data
+
+
+def _fibonacci_prefix(length: int) -> tuple[str, str]:
+    """Соседние слова Фибоначчи S_(k-1), S_k с len(S_k) >= length; S_k = S_(k-1) + S_(k-2)"""
+    previous, current = "a", "ab"
+    while len(current) < length:
+        previous, current = current, current + previous
+    return previous, current
+
+
+def fibonacci_word(length: int, chunk_size: int = CHUNK_SIZE):
+    """Слово Фибоначчи 'abaababaabaab...' - неподвижная точка подстановки a -> ab, b -> a
+
+    Слово равно своему образу при k-кратной подстановке, поэтому его можно выдавать
+    блоками S_k (вместо каждой 'a') и S_(k-1) (вместо каждой 'b'), где len(S_k) >= chunk_size.
+    Порядок блоков задаёт короткий префикс того же слова.
+    """
+    small, big = _fibonacci_prefix(chunk_size)
+    letters = _fibonacci_prefix(length // len(small) + 1)[1]
+    return _chunked((big if letter == "a" else small for letter in letters), length, chunk_size)
+
+
+def thue_morse(length: int, chunk_size: int = CHUNK_SIZE):
+    """Слово Туэ-Морса: i-й символ - чётность числа единиц в двоичной записи i"""
+    return _chunked(("ab"[i.bit_count() & 1] for i in range(length)), length, chunk_size)
+
+
+def de_bruijn(alphabet: str, order: int, chunk_size: int = CHUNK_SIZE):
+    """Последовательность де Брёйна: каждая строка длины order встречается ровно один раз (циклически)"""
+    k = len(alphabet)
+    sequence = [0] * (k * order)
+
+    def generate(t, p):
+        if t > order:
+            if order % p == 0:
+                for index in sequence[1:p + 1]:
+                    yield alphabet[index]
+        else:
+            sequence[t] = sequence[t - p]
+            yield from generate(t + 1, p)
+            for j in range(sequence[t - p] + 1, k):
+                sequence[t] = j
+                yield from generate(t + 1, t)
+
+    return _chunked(generate(1, 1), k ** order, chunk_size)
+
+
+def random_text(length: int, alphabet: str = ALPHABETS["latin"], seed: int = 0, chunk_size: int = CHUNK_SIZE):
+    """Равномерно случайный текст над заданным алфавитом"""
+    rng = random.Random(seed)
+
+    def chunks():
+        produced = 0
+        while produced < length:
+            size = min(chunk_size, length - produced)
+            yield "".join(rng.choices(alphabet, k=size))
+            produced += size
+
+    return chunks()
+
+
+def zipf_text(length: int, vocabulary_size: int = 5000, exponent: float = 1.1,
+              alphabet: str = ALPHABETS["cyrillic"], seed: int = 0, chunk_size: int = CHUNK_SIZE):
+    """Текст, похожий на естественный: слова через пробел с частотами по закону Ципфа"""
+    rng = random.Random(seed)
+    vocabulary = ["".join(rng.choices(alphabet, k=rng.randint(2, 10))) for _ in range(vocabulary_size)]
+    cum_weights = []
+    total = 0.0
+    for rank in range(1, vocabulary_size + 1):
+        total += 1 / rank ** exponent
+        cum_weights.append(total)
+
+    def words():
+        while True:
+            for word in rng.choices(vocabulary, cum_weights=cum_weights, k=1024):
+                yield word + " "
+
+    return _chunked(words(), length, chunk_size)
+
+
+def planted_text(length: int, pattern: str, density: float, alphabet: str = ALPHABETS["latin"],
+                 seed: int = 0, chunk_size: int = CHUNK_SIZE):
+    """Случайный текст со вставленным шаблоном: перед каждым символом шаблон вставляется с вероятностью density"""
+    rng = random.Random(seed)
+
+    def pieces():
+        while True:
+            yield pattern if rng.random() < density else rng.choice(alphabet)
+
+    return _chunked(pieces(), length, chunk_size)
+
+
+def matching_patterns(text: str, count: int, length: int, seed: int = 0) -> list[str]:
+    """Шаблоны, вырезанные из текста: каждый встречается хотя бы один раз"""
+    rng = random.Random(seed)
+    return [text[start:start + length] for start in (rng.randrange(len(text) - length + 1) for _ in range(count))]
+
+
+def absent_patterns(text: str, count: int, length: int, alphabet: str, seed: int = 0,
+                    max_attempts: int = 100000) -> list[str]:
+    """Случайные шаблоны над алфавитом, которых нет в тексте"""
+    rng = random.Random(seed)
+    result = []
+    for _ in range(max_attempts):
+        if len(result) == count:
+            break
+        candidate = "".join(rng.choices(alphabet, k=length))
+        if candidate not in text:
+            result.append(candidate)
+    return result
+
+
+def take(chunks) -> str:
+    """Собирает текст из кусков целиком (для небольших размеров)"""
+    return "".join(chunks)
+
+
+def write_chunks(path: str, chunks) -> int:
+    """Пишет поток кусков в файл UTF-8, возвращает число символов"""
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in chunks:
+            f.write(chunk)
+            written += len(chunk)
+    return written
+
+
+if __name__ == "__main__":
+    print(take(fibonacci_word(20)))
+    print(take(thue_morse(16)))
+    print(take(de_bruijn("ab", 3)))
+    print(take(random_text(20, ALPHABETS["dna"], seed=1)))
+    print(take(islice(zipf_text(60, seed=1, chunk_size=30), 2)))
+    print(take(planted_text(40, "дуб", 0.1, ALPHABETS["cyrillic"], seed=2)))